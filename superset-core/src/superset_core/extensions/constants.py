@@ -19,13 +19,18 @@
 Constants for extension validation and naming.
 """
 
-# Publisher validation pattern: lowercase letters, numbers, hyphens; must start with
-# letter; no consecutive hyphens or trailing hyphens
-PUBLISHER_PATTERN = r"^[a-z]([a-z0-9]*(-[a-z0-9]+)*)?$"
+import re
 
-# Technical name validation pattern: lowercase letters, numbers, hyphens; must start
-# with letter; no consecutive hyphens or trailing hyphens
-TECHNICAL_NAME_PATTERN = r"^[a-z]([a-z0-9]*(-[a-z0-9]+)*)?$"
+# Identifier validation pattern shared by publishers and technical names: lowercase
+# letters, numbers, hyphens; must start with letter; no consecutive hyphens or
+# trailing hyphens
+IDENT_PATTERN = r"^[a-z][a-z0-9]*(?:-[a-z0-9]+)*$"
+
+# Publisher validation pattern (e.g., "my-org")
+PUBLISHER_PATTERN = IDENT_PATTERN
+
+# Technical name validation pattern (e.g., "dashboard-widgets")
+TECHNICAL_NAME_PATTERN = IDENT_PATTERN
 
 # Display name validation pattern: must start with letter, can contain letters,
 # numbers, spaces, hyphens, underscores, dots
@@ -33,3 +38,14 @@ DISPLAY_NAME_PATTERN = r"^[a-zA-Z][a-zA-Z0-9\s\-_\.]*$"
 
 # Version pattern for semantic versioning
 VERSION_PATTERN = r"^\d+\.\d+\.\d+$"
+
+# Compiled counterparts of the patterns above. Validators should match against these
+# rather than passing the raw pattern strings to the ``re`` module on every call, and
+# use ``fullmatch``: the patterns keep their ``^``/``$`` anchors for the pydantic
+# models, but under ``re`` a ``$`` also matches before a trailing newline. All of
+# them describe ASCII-only values, so ``\s`` and ``\d`` are restricted to ASCII too.
+IDENT_RE = re.compile(IDENT_PATTERN, re.ASCII)
+PUBLISHER_RE = IDENT_RE
+TECHNICAL_NAME_RE = IDENT_RE
+DISPLAY_NAME_RE = re.compile(DISPLAY_NAME_PATTERN, re.ASCII)
+VERSION_RE = re.compile(VERSION_PATTERN, re.ASCII)
@@ -15,19 +15,21 @@
 # specific language governing permissions and limitations
 # under the License.
 
-import json  # noqa: TID251
-import re
+from __future__ import annotations
+
+import os
 import shutil
+import signal
 import subprocess
 import sys
-import time
-import zipfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Iterator
 
 import click
-import semver
-from jinja2 import Environment, FileSystemLoader
+from pydantic_core import from_json
 from superset_core.extensions.types import (
     ExtensionConfig,
     Manifest,
@@ -35,15 +37,15 @@ from superset_core.extensions.types import (
     ManifestFrontend,
 )
 from watchdog.events import FileSystemEventHandler
-from watchdog.observers import Observer
 
-from superset_extensions_cli.constants import MIN_NPM_VERSION
+from superset_extensions_cli.constants import MIN_NPM_VERSION, MIN_NPM_VERSION_INFO
 from superset_extensions_cli.exceptions import ExtensionNameError
 from superset_extensions_cli.types import ExtensionNames
 from superset_extensions_cli.utils import (
     generate_extension_names,
     get_module_federation_name,
     kebab_to_snake_case,
+    parse_json,
     read_json,
     read_toml,
     suggest_technical_name,
@@ -54,12 +56,88 @@ from superset_extensions_cli.utils import (
     write_toml,
 )
 
-REMOTE_ENTRY_REGEX = re.compile(r"^remoteEntry\..+\.js$")
-FRONTEND_DIST_REGEX = re.compile(r"/frontend/dist")
+if TYPE_CHECKING:
+    from jinja2 import Environment
+
+# Dependencies only needed by a single command (jinja2, semver, zipfile and the
+# watchdog observers) are imported inside the functions using them to keep CLI
+# startup fast.
+
+REMOTE_ENTRY_PREFIX = "remoteEntry."
+REMOTE_ENTRY_SUFFIX = ".js"
+
+# How long watch mode waits for a burst of file system events (e.g. an editor
+# writing a temp file and renaming it) to settle before rebuilding
+WATCH_DEBOUNCE_SECONDS = 0.3
+
+# Chunk size used when streaming files into the bundle
+ZIP_COPY_BUFFER_SIZE = 1024 * 1024
+
+# Assets that are already compressed gain nothing from DEFLATE, so they are stored
+# as-is in the bundle
+PRECOMPRESSED_SUFFIXES = frozenset(
+    {
+        ".br",
+        ".gif",
+        ".gz",
+        ".ico",
+        ".jpeg",
+        ".jpg",
+        ".png",
+        ".webp",
+        ".woff",
+        ".woff2",
+        ".zip",
+    }
+)
+
+
+def is_remote_entry(filename: str) -> bool:
+    """Check whether `filename` looks like `remoteEntry.<hash>.js`."""
+    return (
+        len(filename) > len(REMOTE_ENTRY_PREFIX) + len(REMOTE_ENTRY_SUFFIX)
+        and filename.startswith(REMOTE_ENTRY_PREFIX)
+        and filename.endswith(REMOTE_ENTRY_SUFFIX)
+    )
+
+
+def get_zip_compress_type(path: Path) -> int:
+    """Pick the zip compression method for a bundled file based on its suffix."""
+    import zipfile
+
+    if path.suffix.lower() in PRECOMPRESSED_SUFFIXES:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def is_below_min_npm_version(npm_version: str) -> bool:
+    """
+    Check whether `npm_version` is lower than MIN_NPM_VERSION.
+
+    Plain `X.Y.Z` versions, which is what `npm -v` normally prints, are compared
+    as integer tuples. Anything else (pre-releases, build metadata, malformed
+    output) goes through semver.
+
+    Raises:
+        ValueError: If `npm_version` is not a valid semantic version
+    """
+    parts = npm_version.split(".")
+    if len(parts) == 3 and all(part.isdecimal() for part in parts):
+        return tuple(int(part) for part in parts) < MIN_NPM_VERSION_INFO
+
+    import semver
 
+    return semver.Version.parse(npm_version).compare(MIN_NPM_VERSION) < 0
 
+
+@lru_cache(maxsize=1)
 def validate_npm() -> None:
-    """Abort if `npm` is not on PATH."""
+    """
+    Abort if `npm` is not on PATH or older than the minimum supported version.
+
+    A successful check is cached for the rest of the process, so later callers
+    don't spawn `npm -v` again.
+    """
     if shutil.which("npm") is None:
         click.secho(
             "❌ npm is not installed or not on your PATH.",
@@ -84,7 +162,7 @@ def validate_npm() -> None:
             sys.exit(1)
 
         npm_version = result.stdout.strip()
-        if semver.compare(npm_version, MIN_NPM_VERSION) < 0:
+        if is_below_min_npm_version(npm_version):
             click.secho(
                 f"❌ npm version {npm_version} is lower than the required {MIN_NPM_VERSION}.",  # noqa: E501
                 err=True,
@@ -143,14 +221,45 @@ def clean_dist_frontend(cwd: Path) -> None:
         shutil.rmtree(frontend_dist)
 
 
-def build_manifest(cwd: Path, remote_entry: str | None) -> Manifest:
-    extension_data = read_json(cwd / "extension.json")
+@lru_cache(maxsize=8)
+def _parse_extension_config(content: bytes) -> ExtensionConfig | None:
+    extension_data = parse_json(content)
     if not extension_data:
+        return None
+    return ExtensionConfig.model_validate(extension_data)
+
+
+def load_extension_config(cwd: Path) -> ExtensionConfig | None:
+    """
+    Parse and validate `extension.json` under `cwd`.
+
+    The file is read on every call, but the validated config is cached by its
+    content, so `build` and the `dev` rebuild loop only re-validate it after an
+    edit. Keying on the bytes rather than on mtime and size means an edit is
+    never missed, even one that keeps the size and lands within the
+    filesystem's timestamp granularity.
+
+    Returns:
+        The validated config, or None if the file is missing or holds an empty
+        JSON object (`{}`)
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON, including when it
+            is empty
+        pydantic.ValidationError: If the file content is not a valid config
+    """
+    path = cwd / "extension.json"
+    if not path.is_file():
+        return None
+    return _parse_extension_config(path.read_bytes())
+
+
+def build_manifest(cwd: Path, remote_entry: str | None) -> Manifest:
+    extension = load_extension_config(cwd)
+    if not extension:
         click.secho("❌ extension.json not found.", err=True, fg="red")
         sys.exit(1)
 
-    extension = ExtensionConfig.model_validate(extension_data)
-
     frontend: ManifestFrontend | None = None
     if remote_entry:
         frontend = ManifestFrontend(
@@ -199,28 +308,75 @@ def run_frontend_build(frontend_dir: Path) -> subprocess.CompletedProcess[str]:
     )
 
 
-def copy_frontend_dist(cwd: Path) -> str:
+def walk_files(root: Path) -> Iterator[os.DirEntry[str]]:
+    """
+    Yield every file under `root`, recursively.
+
+    Uses `os.scandir` so the file/directory checks are answered from the directory
+    listing instead of a `stat` call per entry. Symlinked directories are not
+    followed, matching `Path.rglob`.
+    """
+    if not root.is_dir():
+        return
+
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                elif entry.is_file():
+                    yield entry
+
+
+def copy_files(copies: list[tuple[Path | str, Path]]) -> None:
+    """
+    Copy each `(src, tgt)` pair, creating the target directories up front.
+
+    The copies themselves are I/O bound, so they are fanned out over a thread pool.
+    """
+    for parent in {tgt.parent for _, tgt in copies}:
+        parent.mkdir(parents=True, exist_ok=True)
+
+    with ThreadPoolExecutor() as executor:
+        # Consume the results so that any copy error is raised here
+        list(executor.map(lambda pair: shutil.copy2(*pair), copies))
+
+
+def plan_frontend_copies(
+    cwd: Path,
+) -> tuple[list[tuple[Path | str, Path]], str | None]:
+    """
+    Collect the frontend build files to stage under dist/ in a single walk.
+
+    Returns:
+        The `(src, tgt)` pairs to copy and the remoteEntry filename, if found
+    """
     dist_dir = cwd / "dist"
     frontend_dist = cwd / "frontend" / "dist"
     remote_entry: str | None = None
+    copies: list[tuple[Path | str, Path]] = []
+
+    for entry in walk_files(frontend_dist):
+        if is_remote_entry(entry.name):
+            remote_entry = entry.name
+        copies.append((entry.path, dist_dir / Path(entry.path).relative_to(cwd)))
+
+    return copies, remote_entry
 
-    for f in frontend_dist.rglob("*"):
-        if not f.is_file():
-            continue
-        if REMOTE_ENTRY_REGEX.match(f.name):
-            remote_entry = f.name
-        tgt = dist_dir / f.relative_to(cwd)
-        tgt.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(f, tgt)
 
+def copy_frontend_dist(cwd: Path) -> str:
+    copies, remote_entry = plan_frontend_copies(cwd)
     if not remote_entry:
         click.secho("❌ No remote entry file found.", err=True, fg="red")
         sys.exit(1)
+
+    copy_files(copies)
     return remote_entry
 
 
-def copy_backend_files(cwd: Path) -> None:
-    """Copy backend files based on pyproject.toml build configuration (validation already passed)."""
+def plan_backend_copies(cwd: Path) -> list[tuple[Path | str, Path]]:
+    """Collect the backend files to stage under dist/ based on pyproject.toml."""
     dist_dir = cwd / "dist"
     backend_dir = (cwd / "backend").resolve()
 
@@ -232,6 +388,10 @@ def copy_backend_files(cwd: Path) -> None:
     )
     include_patterns = build_config.get("include", [])
     exclude_patterns = build_config.get("exclude", [])
+    copies: list[tuple[Path | str, Path]] = []
+    # Files matched by more than one include pattern are only checked and
+    # copied once
+    seen: set[Path] = set()
 
     # Process include patterns
     for pattern in include_patterns:
@@ -245,8 +405,9 @@ def copy_backend_files(cwd: Path) -> None:
                 "relative to the backend directory and may not contain '..'."
             )
         for f in backend_dir.glob(pattern):
-            if not f.is_file():
+            if f in seen or not f.is_file():
                 continue
+            seen.add(f)
 
             # Defense in depth: confirm the matched file resolves to a location
             # inside the backend directory before copying it into the bundle.
@@ -267,9 +428,14 @@ def copy_backend_files(cwd: Path) -> None:
             if should_exclude:
                 continue
 
-            tgt = dist_dir / "backend" / relative_path
-            tgt.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(f, tgt)
+            copies.append((f, dist_dir / "backend" / relative_path))
+
+    return copies
+
+
+def copy_backend_files(cwd: Path) -> None:
+    """Copy backend files based on pyproject.toml build configuration (validation already passed)."""
+    copy_files(plan_backend_copies(cwd))
 
 
 def rebuild_frontend(cwd: Path, frontend_dir: Path) -> str | None:
@@ -292,15 +458,100 @@ def rebuild_backend(cwd: Path) -> None:
     click.secho("✅ Backend files synced", fg="green")
 
 
-class FrontendChangeHandler(FileSystemEventHandler):
-    def __init__(self, trigger_build: Callable[[], None]):
+class DebouncedChangeHandler(FileSystemEventHandler):
+    """
+    Run `trigger_build` once a burst of file system events has settled.
+
+    Every event restarts a timer, so a save that produces several events only
+    triggers a single build after `debounce_seconds` without further changes.
+
+    Builds never overlap: a timer firing while a build is running only marks a
+    rebuild as pending, and any number of those coalesce into one rebuild once
+    the current build finishes. Handlers sharing `build_lock` also never build
+    at the same time as each other.
+    """
+
+    def __init__(
+        self,
+        trigger_build: Callable[[], None],
+        debounce_seconds: float = WATCH_DEBOUNCE_SECONDS,
+        build_lock: threading.Lock | None = None,
+    ):
         self.trigger_build = trigger_build
+        self.debounce_seconds = debounce_seconds
+        self._timer: threading.Timer | None = None
+        # Guards the timer and the building/pending flags
+        self._lock = threading.Lock()
+        self._build_lock = build_lock or threading.Lock()
+        self._building = False
+        self._rebuild_pending = False
+
+    def schedule_build(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.debounce_seconds, self._run_build)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _run_build(self) -> None:
+        with self._lock:
+            if self._building:
+                # The running build picks this up when it finishes
+                self._rebuild_pending = True
+                return
+            self._building = True
+
+        try:
+            while True:
+                with self._build_lock:
+                    self.trigger_build()
+                with self._lock:
+                    if not self._rebuild_pending:
+                        self._building = False
+                        return
+                    self._rebuild_pending = False
+        except BaseException:
+            with self._lock:
+                self._building = self._rebuild_pending = False
+            raise
+
+    def on_any_event(self, event: Any) -> None:
+        self.schedule_build()
 
+
+class FrontendChangeHandler(DebouncedChangeHandler):
     def on_any_event(self, event: Any) -> None:
-        if FRONTEND_DIST_REGEX.search(event.src_path):
+        if "/frontend/dist" in event.src_path:
             return
         click.secho(f"🔁 Frontend change detected: {event.src_path}", fg="yellow")
-        self.trigger_build()
+        self.schedule_build()
+
+
+def wait_for_interrupt() -> None:
+    """
+    Block until the user stops the process with Ctrl+C.
+
+    Waits on an event set from the SIGINT handler rather than polling, so the
+    process stays idle between file changes.
+    """
+    stop_event = threading.Event()
+    previous_handler = None
+    # Signal handlers can only be installed from the main thread
+    if threading.current_thread() is threading.main_thread():
+        previous_handler = signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+
+    # An untimed wait isn't interrupted by signals on Windows, so wake up
+    # periodically there to give the handler a chance to run
+    timeout = 1.0 if sys.platform == "win32" else None
+    try:
+        while not stop_event.wait(timeout):
+            pass
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if previous_handler is not None:
+            signal.signal(signal.SIGINT, previous_handler)
 
 
 @click.group(help="CLI for validating and bundling Superset extensions.")
@@ -316,17 +567,16 @@ def validate() -> None:
     cwd = Path.cwd()
 
     # Validate extension.json exists and is valid
-    extension_data = read_json(cwd / "extension.json")
-    if not extension_data:
-        click.secho("❌ extension.json not found.", err=True, fg="red")
-        sys.exit(1)
-
     try:
-        extension = ExtensionConfig.model_validate(extension_data)
+        extension = load_extension_config(cwd)
     except Exception as e:
         click.secho(f"❌ Invalid extension.json: {e}", err=True, fg="red")
         sys.exit(1)
 
+    if not extension:
+        click.secho("❌ extension.json not found.", err=True, fg="red")
+        sys.exit(1)
+
     # Validate conventional backend structure if backend directory exists
     backend_dir = cwd / "backend"
     if backend_dir.exists():
@@ -600,7 +850,7 @@ def bundle(ctx: click.Context, output: Path | None) -> None:
         )
         sys.exit(1)
 
-    manifest = json.loads(manifest_path.read_text())
+    manifest = from_json(manifest_path.read_bytes())
     name = manifest["name"]
     version = manifest["version"]
     default_filename = f"{name}-{version}.supx"
@@ -612,12 +862,16 @@ def bundle(ctx: click.Context, output: Path | None) -> None:
     else:
         zip_path = output
 
+    import zipfile
+
     try:
         with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-            for file in dist_dir.rglob("*"):
-                if file.is_file():
-                    arcname = file.relative_to(dist_dir)
-                    zipf.write(file, arcname)
+            for entry in walk_files(dist_dir):
+                file = Path(entry.path)
+                zinfo = zipfile.ZipInfo.from_file(file, file.relative_to(dist_dir))
+                zinfo.compress_type = get_zip_compress_type(file)
+                with file.open("rb") as src, zipf.open(zinfo, "w") as dest:
+                    shutil.copyfileobj(src, dest, ZIP_COPY_BUFFER_SIZE)
     except Exception as ex:
         click.secho(f"❌ Failed to create bundle: {ex}", err=True, fg="red")
         sys.exit(1)
@@ -629,6 +883,8 @@ def bundle(ctx: click.Context, output: Path | None) -> None:
 @click.pass_context
 def dev(ctx: click.Context) -> None:
     """Automatically rebuild the extension as files change."""
+    from watchdog.observers import Observer
+
     cwd = Path.cwd()
     frontend_dir = cwd / "frontend"
     backend_dir = cwd / "backend"
@@ -646,12 +902,21 @@ def dev(ctx: click.Context) -> None:
         rebuild_backend(cwd)
 
     manifest = build_manifest(cwd, remote_entry)
+    manifest_extension = load_extension_config(cwd)
     write_manifest(cwd, manifest)
 
     def frontend_watcher() -> None:
+        nonlocal manifest, manifest_extension
         if frontend_dir.exists():
             if (remote_entry := rebuild_frontend(cwd, frontend_dir)) is not None:
-                manifest = build_manifest(cwd, remote_entry)
+                # Between frontend rebuilds usually only the remote entry hash
+                # changes, so reuse the manifest unless extension.json was edited
+                extension = load_extension_config(cwd)
+                if manifest.frontend is not None and extension is manifest_extension:
+                    manifest.frontend.remoteEntry = remote_entry
+                else:
+                    manifest = build_manifest(cwd, remote_entry)
+                    manifest_extension = extension
                 write_manifest(cwd, manifest)
 
     def backend_watcher() -> None:
@@ -671,32 +936,61 @@ def dev(ctx: click.Context) -> None:
         click.secho("⚠️  No frontend or backend directories found to watch", fg="yellow")
 
     observer = Observer()
+    # Both rebuilds write into dist/ (and the frontend one updates the shared
+    # manifest), so only one of them may run at a time
+    build_lock = threading.Lock()
 
     # Only set up watchers for directories that exist
     if frontend_dir.exists():
-        frontend_handler = FrontendChangeHandler(trigger_build=frontend_watcher)
+        frontend_handler = FrontendChangeHandler(
+            trigger_build=frontend_watcher, build_lock=build_lock
+        )
         observer.schedule(frontend_handler, str(frontend_dir), recursive=True)
 
     if backend_dir.exists():
-        backend_handler = FileSystemEventHandler()
-        backend_handler.on_any_event = lambda event: backend_watcher()
+        backend_handler = DebouncedChangeHandler(
+            trigger_build=backend_watcher, build_lock=build_lock
+        )
         observer.schedule(backend_handler, str(backend_dir), recursive=True)
 
     if watch_dirs:
         observer.start()
+        wait_for_interrupt()
 
-        try:
-            while True:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            click.secho("\n🛑 Stopping watch mode", fg="blue")
-            observer.stop()
-
+        click.secho("\n🛑 Stopping watch mode", fg="blue")
+        observer.stop()
         observer.join()
     else:
         click.secho("❌ No directories to watch. Exiting.", fg="red")
 
 
+def write_files(base_dir: Path, files: dict[str, str]) -> None:
+    """Write `files`, a mapping of relative path to content, under `base_dir`."""
+    for relative_path, content in files.items():
+        path = base_dir / relative_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+@lru_cache(maxsize=1)
+def get_template_env() -> Environment:
+    """
+    Return the Jinja environment for the bundled `init` templates.
+
+    Built once per process so compiled templates are reused across `init` runs.
+    The templates ship with the package and never change at runtime, so the
+    auto-reload mtime checks are skipped and compiled templates are never evicted.
+    """
+    from jinja2 import Environment, FileSystemLoader
+
+    templates_dir = Path(__file__).parent / "templates"
+    return Environment(  # noqa: S701
+        loader=FileSystemLoader(templates_dir),
+        auto_reload=False,
+        cache_size=-1,
+    )
+
+
 def prompt_for_extension_info(
     display_name_opt: str | None,
     publisher_opt: str | None,
@@ -845,9 +1139,7 @@ def init(
         click.secho(f"❌ Directory {target_dir} already exists.", fg="red")
         sys.exit(1)
 
-    # Set up Jinja environment
-    templates_dir = Path(__file__).parent / "templates"
-    env = Environment(loader=FileSystemLoader(templates_dir))  # noqa: S701
+    env = get_template_env()
     ctx = {
         **names,  # Include all name variants
         "include_frontend": include_frontend,
@@ -856,62 +1148,50 @@ def init(
         "version": version,
     }
 
-    # Create base directory
-    target_dir.mkdir()
-    extension_json = env.get_template("extension.json.j2").render(ctx)
-    (target_dir / "extension.json").write_text(extension_json)
-    click.secho("✅ Created extension.json", fg="green")
+    def render(template_name: str) -> str:
+        return env.get_template(template_name).render(ctx)
 
-    # Create .gitignore
-    gitignore = env.get_template("gitignore.j2").render(ctx)
-    (target_dir / ".gitignore").write_text(gitignore)
-    click.secho("✅ Created .gitignore", fg="green")
+    # Render every file before touching the disk, so that a template error can't
+    # leave a half-initialized extension behind
+    base_files = {
+        "extension.json": render("extension.json.j2"),
+        ".gitignore": render("gitignore.j2"),
+    }
 
-    # Initialize frontend files
+    frontend_files: dict[str, str] = {}
     if include_frontend:
-        frontend_dir = target_dir / "frontend"
-        frontend_dir.mkdir()
-        frontend_src_dir = frontend_dir / "src"
-        frontend_src_dir.mkdir()
-
-        # frontend files
-        package_json = env.get_template("frontend/package.json.j2").render(ctx)
-        (frontend_dir / "package.json").write_text(package_json)
-        webpack_config = env.get_template("frontend/webpack.config.js.j2").render(ctx)
-        (frontend_dir / "webpack.config.js").write_text(webpack_config)
-        tsconfig_json = env.get_template("frontend/tsconfig.json.j2").render(ctx)
-        (frontend_dir / "tsconfig.json").write_text(tsconfig_json)
-        index_tsx = env.get_template("frontend/src/index.tsx.j2").render(ctx)
-        (frontend_src_dir / "index.tsx").write_text(index_tsx)
-        click.secho("✅ Created frontend folder structure", fg="green")
-
-    # Initialize backend files with publisher.name structure
+        frontend_files = {
+            "frontend/package.json": render("frontend/package.json.j2"),
+            "frontend/webpack.config.js": render("frontend/webpack.config.js.j2"),
+            "frontend/tsconfig.json": render("frontend/tsconfig.json.j2"),
+            "frontend/src/index.tsx": render("frontend/src/index.tsx.j2"),
+        }
+
+    # Backend files follow the publisher.name package structure
+    # (e.g., backend/src/my_org/dashboard_widgets)
+    backend_files: dict[str, str] = {}
     if include_backend:
-        backend_dir = target_dir / "backend"
-        backend_dir.mkdir()
-        backend_src_dir = backend_dir / "src"
-        backend_src_dir.mkdir()
-
-        # Create publisher directory (e.g., my_org)
         publisher_snake = kebab_to_snake_case(names["publisher"])
-        publisher_dir = backend_src_dir / publisher_snake
-        publisher_dir.mkdir()
-
-        # Create extension package directory (e.g., my_org/dashboard_widgets)
         name_snake = kebab_to_snake_case(names["name"])
-        extension_package_dir = publisher_dir / name_snake
-        extension_package_dir.mkdir()
+        backend_files = {
+            "backend/pyproject.toml": render("backend/pyproject.toml.j2"),
+            f"backend/src/{publisher_snake}/{name_snake}/entrypoint.py": render(
+                "backend/src/package/entrypoint.py.j2"
+            ),
+        }
 
-        # backend files
-        pyproject_toml = env.get_template("backend/pyproject.toml.j2").render(ctx)
-        (backend_dir / "pyproject.toml").write_text(pyproject_toml)
+    # Create base directory
+    target_dir.mkdir()
+    write_files(target_dir, base_files)
+    click.secho("✅ Created extension.json", fg="green")
+    click.secho("✅ Created .gitignore", fg="green")
 
-        # Extension package files
-        entrypoint_py = env.get_template("backend/src/package/entrypoint.py.j2").render(
-            ctx
-        )
-        (extension_package_dir / "entrypoint.py").write_text(entrypoint_py)
+    if frontend_files:
+        write_files(target_dir, frontend_files)
+        click.secho("✅ Created frontend folder structure", fg="green")
 
+    if backend_files:
+        write_files(target_dir, backend_files)
         click.secho("✅ Created backend folder structure", fg="green")
 
     click.secho(
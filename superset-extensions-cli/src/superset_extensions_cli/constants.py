@@ -17,3 +17,4 @@
 
 
 MIN_NPM_VERSION = "10.8.2"
+MIN_NPM_VERSION_INFO = tuple(int(part) for part in MIN_NPM_VERSION.split("."))
@@ -16,99 +16,144 @@
 # under the License.
 
 import json  # noqa: TID251
-import re
+import string
 import sys
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import tomli_w
+from pydantic_core import from_json
 
-from superset_core.extensions.constants import (
-    DISPLAY_NAME_PATTERN,
-    PUBLISHER_PATTERN,
-    TECHNICAL_NAME_PATTERN,
-)
+from superset_core.extensions.constants import IDENT_RE
 from superset_extensions_cli.exceptions import ExtensionNameError
 from superset_extensions_cli.types import ExtensionNames
 
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    import tomli as tomllib
-
 # Python reserved keywords to avoid in package names
-PYTHON_KEYWORDS = {
-    "and",
-    "as",
-    "assert",
-    "break",
-    "class",
-    "continue",
-    "def",
-    "del",
-    "elif",
-    "else",
-    "except",
-    "exec",
-    "finally",
-    "for",
-    "from",
-    "global",
-    "if",
-    "import",
-    "in",
-    "is",
-    "lambda",
-    "not",
-    "or",
-    "pass",
-    "print",
-    "raise",
-    "return",
-    "try",
-    "while",
-    "with",
-    "yield",
-    "False",
-    "None",
-    "True",
-}
+PYTHON_KEYWORDS = frozenset(
+    {
+        "and",
+        "as",
+        "assert",
+        "break",
+        "class",
+        "continue",
+        "def",
+        "del",
+        "elif",
+        "else",
+        "except",
+        "exec",
+        "finally",
+        "for",
+        "from",
+        "global",
+        "if",
+        "import",
+        "in",
+        "is",
+        "lambda",
+        "not",
+        "or",
+        "pass",
+        "print",
+        "raise",
+        "return",
+        "try",
+        "while",
+        "with",
+        "yield",
+        "False",
+        "None",
+        "True",
+    }
+)
 
 # npm reserved names to avoid
-NPM_RESERVED = {
-    "node_modules",
-    "favicon.ico",
-    "www",
-    "http",
-    "https",
-    "ftp",
-    "localhost",
-    "package.json",
-    "npm",
-    "yarn",
-    "bower_components",
-}
-
-# Compiled patterns for publisher/name validation
-PUBLISHER_REGEX = re.compile(PUBLISHER_PATTERN)
-TECHNICAL_NAME_REGEX = re.compile(TECHNICAL_NAME_PATTERN)
-DISPLAY_NAME_REGEX = re.compile(DISPLAY_NAME_PATTERN)
+NPM_RESERVED = frozenset(
+    {
+        "node_modules",
+        "favicon.ico",
+        "www",
+        "http",
+        "https",
+        "ftp",
+        "localhost",
+        "package.json",
+        "npm",
+        "yarn",
+        "bower_components",
+    }
+)
+
+# Translation table that deletes every character allowed after the first one in a
+# normalized display name; anything left over is invalid. Equivalent to
+# DISPLAY_NAME_PATTERN once whitespace has been collapsed to single spaces.
+DISPLAY_NAME_STRIP_TABLE = str.maketrans(
+    "", "", string.ascii_letters + string.digits + " -_."
+)
+
+
+class _IdentifierCharTable(dict[int, int | None]):
+    """
+    ``str.translate`` table that keeps a-z, 0-9 and whitespace, turns underscores
+    and hyphens into spaces, and deletes everything else. Entries are filled in on
+    first lookup so the table only ever holds code points that have been seen.
+    """
+
+    def __missing__(self, codepoint: int) -> int | None:
+        char = chr(codepoint)
+        keep = "a" <= char <= "z" or "0" <= char <= "9" or char.isspace()
+        self[codepoint] = result = codepoint if keep else None
+        return result
+
+
+IDENTIFIER_CHAR_TABLE = _IdentifierCharTable({ord("_"): ord(" "), ord("-"): ord(" ")})
+
+# ``bytes.translate`` equivalent of IDENTIFIER_CHAR_TABLE for ASCII-only names, which
+# also folds uppercase letters so no separate ``lower()`` pass is needed. Deletion is
+# applied to the input bytes before mapping, hence the separate delete set.
+_ASCII_SEPARATORS = "_-" + "".join(c for c in map(chr, range(128)) if c.isspace())
+ASCII_IDENTIFIER_TABLE = bytes.maketrans(
+    (string.ascii_uppercase + _ASCII_SEPARATORS).encode(),
+    (string.ascii_lowercase + " " * len(_ASCII_SEPARATORS)).encode(),
+)
+ASCII_IDENTIFIER_DELETE = bytes(
+    i
+    for i in range(128)
+    if chr(i) not in string.ascii_letters + string.digits + _ASCII_SEPARATORS
+)
 
 
 def read_toml(path: Path) -> dict[str, Any] | None:
     if not path.is_file():
         return None
 
+    # The parser is imported here so commands that never read TOML don't pay
+    # for it at startup
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        import tomli as tomllib
+
     with path.open("rb") as f:
         return tomllib.load(f)
 
 
 def read_json(path: Path) -> dict[str, Any] | None:
-    path = Path(path)
     if not path.is_file():
         return None
 
-    return json.loads(path.read_text())
+    return parse_json(path.read_bytes())
+
+
+def parse_json(data: bytes) -> Any:
+    try:
+        return from_json(data)
+    except ValueError:
+        # Let the stdlib parser report the error, so callers keep getting a
+        # json.JSONDecodeError with line and column information
+        return json.loads(data)
 
 
 def write_json(path: Path, data: dict[str, Any]) -> None:
@@ -116,71 +161,95 @@ def write_json(path: Path, data: dict[str, Any]) -> None:
 
 
 def write_toml(path: Path, data: dict[str, Any]) -> None:
+    import tomli_w
+
     path.write_text(tomli_w.dumps(data))
 
 
-def _normalize_for_identifiers(name: str) -> str:
+def _identifier_words(name: str) -> list[str]:
     """
-    Normalize display name to clean lowercase words.
+    Split a display name into clean lowercase words.
+
+    Lowercasing, treating underscores and hyphens as separators, dropping
+    non-alphanumeric characters and collapsing whitespace all happen in one
+    ``translate`` + ``split`` pass.
 
     Args:
-        name: Raw display name (e.g., "Hello World!")
+        name: Raw display name (e.g., "Hello_World!")
 
     Returns:
-        Normalized string (e.g., "hello world")
+        List of words (e.g., ["hello", "world"])
     """
-    # Convert to lowercase
-    normalized = name.lower().strip()
-
-    # Convert underscores and existing hyphens to spaces for consistent processing
-    normalized = normalized.replace("_", " ").replace("-", " ")
-
-    # Remove any non-alphanumeric characters except spaces
-    normalized = re.sub(r"[^a-z0-9\s]", "", normalized)
+    if name.isascii():
+        return (
+            name.encode("ascii")
+            .translate(ASCII_IDENTIFIER_TABLE, ASCII_IDENTIFIER_DELETE)
+            .decode("ascii")
+            .split()
+        )
+    return name.lower().translate(IDENTIFIER_CHAR_TABLE).split()
 
-    # Normalize whitespace (collapse multiple spaces, strip)
-    normalized = " ".join(normalized.split())
 
-    return normalized
+def _normalize_for_identifiers(name: str) -> str:
+    """
+    Normalize display name to clean lowercase words.
 
+    Args:
+        name: Raw display name (e.g., "Hello World!")
 
-def _normalized_to_kebab(normalized: str) -> str:
-    """Convert normalized string to kebab-case."""
-    return normalized.replace(" ", "-")
+    Returns:
+        Normalized string (e.g., "hello world")
+    """
+    return " ".join(_identifier_words(name))
 
 
-def _normalized_to_snake(normalized: str) -> str:
-    """Convert normalized string to snake_case."""
-    return normalized.replace(" ", "_")
+def _derive_all_forms(name: str) -> tuple[str, str, str]:
+    """
+    Derive the kebab, snake and camel case forms of a display name at once.
 
+    Args:
+        name: Raw display name (e.g., "Hello World!")
 
-def _normalized_to_camel(normalized: str) -> str:
-    """Convert normalized string to camelCase."""
-    parts = normalized.split()
-    if not parts:
-        return ""
-    # First part lowercase, subsequent parts capitalized
-    return parts[0] + "".join(word.capitalize() for word in parts[1:])
+    Returns:
+        Tuple of (kebab, snake, camel), e.g. ("hello-world", "hello_world",
+        "helloWorld"); all empty if the name has no usable characters
+    """
+    words = _identifier_words(name)
+    if not words:
+        return "", "", ""
+    camel = words[0] + "".join(map(str.capitalize, words[1:]))
+    return "-".join(words), "_".join(words), camel
 
 
+@lru_cache(maxsize=256)
 def kebab_to_camel_case(kebab_name: str) -> str:
     """Convert kebab-case to camelCase (e.g., 'hello-world' -> 'helloWorld')."""
+    if "-" not in kebab_name:
+        # Single word, nothing to capitalize
+        return kebab_name
     parts = kebab_name.split("-")
-    if not parts:
-        return ""
     # First part lowercase, subsequent parts capitalized
-    return parts[0] + "".join(word.capitalize() for word in parts[1:])
+    return parts[0] + "".join(map(str.capitalize, parts[1:]))
 
 
+@lru_cache(maxsize=256)
 def kebab_to_snake_case(kebab_name: str) -> str:
     """Convert kebab-case to snake_case (e.g., 'hello-world' -> 'hello_world')."""
     return kebab_name.replace("-", "_")
 
 
+@lru_cache(maxsize=256)
 def name_to_kebab_case(name: str) -> str:
     """Convert display name directly to kebab-case (e.g., 'Hello World' -> 'hello-world')."""
-    normalized = _normalize_for_identifiers(name)
-    return _normalized_to_kebab(normalized)
+    return "-".join(_identifier_words(name))
+
+
+def _check_python_keyword_prefix(first_part: str) -> None:
+    """Reject a package name whose first underscore-separated part is a keyword."""
+    if first_part in PYTHON_KEYWORDS:
+        raise ExtensionNameError(
+            f"Package name cannot start with Python keyword '{first_part}'"
+        )
 
 
 def validate_python_package_name(name: str) -> None:
@@ -190,18 +259,18 @@ def validate_python_package_name(name: str) -> None:
     Raises:
         ExtensionNameError: If name is invalid
     """
+    if not name:
+        raise ExtensionNameError("Package name cannot be empty")
+
     # Check if it starts with a number (invalid for Python identifiers)
     if name[0].isdigit():
         raise ExtensionNameError(f"Package name '{name}' cannot start with a number")
 
     # Check if the first part (before any underscore) is a Python keyword
-    if (first_part := name.split("_")[0]) in PYTHON_KEYWORDS:
-        raise ExtensionNameError(
-            f"Package name cannot start with Python keyword '{first_part}'"
-        )
+    _check_python_keyword_prefix(name.split("_", 1)[0])
 
     # Check if it's a valid Python identifier
-    if not name.replace("_", "a").isalnum():
+    if not name.isidentifier():
         raise ExtensionNameError(f"'{name}' is not a valid Python package name")
 
 
@@ -229,7 +298,7 @@ def validate_publisher(publisher: str) -> None:
     if not publisher:
         raise ExtensionNameError("Publisher cannot be empty")
 
-    if not PUBLISHER_REGEX.match(publisher):
+    if not IDENT_RE.fullmatch(publisher):
         raise ExtensionNameError(
             "Publisher must start with a letter and contain only lowercase letters, numbers, and hyphens (e.g., 'my-org')"
         )
@@ -248,7 +317,7 @@ def validate_technical_name(name: str) -> None:
     if not name:
         raise ExtensionNameError("Extension name cannot be empty")
 
-    if not TECHNICAL_NAME_REGEX.match(name):
+    if not IDENT_RE.fullmatch(name):
         raise ExtensionNameError(
             "Extension name must start with a letter and contain only lowercase letters, numbers, and hyphens (e.g., 'dashboard-widgets')"
         )
@@ -267,26 +336,26 @@ def validate_display_name(display_name: str) -> str:
     Raises:
         ExtensionNameError: If display name is invalid
     """
-    if not display_name or not display_name.strip():
+    # Split on any whitespace once; this both detects blank names and lets the
+    # words be re-joined with single spaces
+    words = display_name.split()
+    if not words:
         raise ExtensionNameError("Display name cannot be empty")
 
-    # Normalize whitespace: strip and collapse multiple spaces
-    normalized = " ".join(display_name.strip().split())
+    normalized = " ".join(words)
 
-    if not DISPLAY_NAME_REGEX.match(normalized):
+    # A leading letter also guarantees the name contains at least one letter
+    if normalized[0] not in string.ascii_letters or normalized.translate(
+        DISPLAY_NAME_STRIP_TABLE
+    ):
         raise ExtensionNameError(
             "Display name must start with a letter and can contain letters, numbers, spaces, hyphens, underscores, and dots (e.g., 'Dashboard Widgets')"
         )
 
-    # Check for only whitespace/special chars after normalization
-    if not any(c.isalnum() for c in normalized):
-        raise ExtensionNameError(
-            "Display name must contain at least one letter or number"
-        )
-
     return normalized
 
 
+@lru_cache(maxsize=256)
 def suggest_technical_name(display_name: str) -> str:
     """
     Suggest technical name from display name.
@@ -297,14 +366,7 @@ def suggest_technical_name(display_name: str) -> str:
     Returns:
         Technical name suggestion (e.g., "dashboard-widgets")
     """
-    # Normalize for identifiers
-    normalized = _normalize_for_identifiers(display_name)
-
-    # Convert to kebab-case
-    technical_name = _normalized_to_kebab(normalized)
-
-    # Remove any leading/trailing hyphens that might result from edge cases
-    technical_name = technical_name.strip("-")
+    technical_name = name_to_kebab_case(display_name)
 
     # Ensure we have something left
     if not technical_name:
@@ -326,37 +388,45 @@ def get_module_federation_name(publisher: str, name: str) -> str:
     Returns:
         Module Federation name (e.g., 'myOrg_dashboardWidgets')
     """
-    publisher_camel = kebab_to_camel_case(publisher)
-    name_camel = kebab_to_camel_case(name)
-    return f"{publisher_camel}_{name_camel}"
-
+    return _make_mf_name(kebab_to_camel_case(publisher), kebab_to_camel_case(name))
 
-def generate_extension_names(
-    display_name: str, publisher: str, technical_name: str | None = None
-) -> ExtensionNames:
-    """
-    Generate all extension name variants from input.
 
-    Args:
-        display_name: Human-readable name (e.g., "Dashboard Widgets")
-        publisher: Publisher namespace (e.g., "my-org")
-        technical_name: Technical name override, or None to auto-generate
+def _make_mf_name(publisher_camel: str, name_camel: str) -> str:
+    """Join already camelCased publisher and name into a Module Federation name."""
+    return f"{publisher_camel}_{name_camel}"
 
-    Returns:
-        ExtensionNames: Dictionary with all name variants
 
-    Raises:
-        ExtensionNameError: If any name is invalid
-    """
-    # Validate and normalize inputs
-    display_name = validate_display_name(display_name)
+def _check_publisher(publisher: str) -> tuple[str, str]:
+    """Validate a publisher and return its (camelCase, snake_case) forms."""
     validate_publisher(publisher)
+    # The publisher is lowercase ASCII words starting with a letter at this point,
+    # so its snake_case form is always an identifier and only the keyword rule is
+    # left to check.
+    _check_python_keyword_prefix(publisher.split("-", 1)[0])
+    return kebab_to_camel_case(publisher), kebab_to_snake_case(publisher)
+
+
+def _build_extension_names(
+    display_name: str,
+    publisher: str,
+    publisher_camel: str,
+    publisher_snake: str,
+    technical_name: str | None,
+) -> ExtensionNames:
+    """Build the name variants for an already validated publisher."""
+    display_name = validate_display_name(display_name)
 
-    # Use provided technical name or generate from display name
+    # Use provided technical name or derive every form from the display name
     if technical_name is None:
-        technical_name = suggest_technical_name(display_name)
+        technical_name, name_snake, name_camel = _derive_all_forms(display_name)
+        if not technical_name:
+            raise ExtensionNameError(
+                "Display name must contain at least one letter or number"
+            )
     else:
         validate_technical_name(technical_name)
+        name_snake = kebab_to_snake_case(technical_name)
+        name_camel = kebab_to_camel_case(technical_name)
 
     # Generate composite ID
     composite_id = f"{publisher}.{technical_name}"
@@ -365,18 +435,16 @@ def generate_extension_names(
     npm_name = f"@{publisher}/{technical_name}"
 
     # Generate Module Federation name
-    mf_name = get_module_federation_name(publisher, technical_name)
+    mf_name = _make_mf_name(publisher_camel, name_camel)
 
     # Generate backend names with collision protection
-    publisher_snake = kebab_to_snake_case(publisher)
-    name_snake = kebab_to_snake_case(technical_name)
     backend_package = f"{publisher_snake}-{name_snake}"
     backend_path = f"{publisher_snake}.{name_snake}"
     backend_entry = f"{backend_path}.entrypoint"
 
-    # Validate the generated names
-    validate_python_package_name(publisher_snake)
-    validate_python_package_name(name_snake)
+    # Validate the generated names. As for the publisher, only the keyword rule
+    # can still fail for the Python package name.
+    _check_python_keyword_prefix(technical_name.split("-", 1)[0])
     validate_npm_package_name(technical_name)
 
     return ExtensionNames(
@@ -390,3 +458,54 @@ def generate_extension_names(
         backend_path=backend_path,
         backend_entry=backend_entry,
     )
+
+
+def generate_extension_names(
+    display_name: str, publisher: str, technical_name: str | None = None
+) -> ExtensionNames:
+    """
+    Generate all extension name variants from input.
+
+    Args:
+        display_name: Human-readable name (e.g., "Dashboard Widgets")
+        publisher: Publisher namespace (e.g., "my-org")
+        technical_name: Technical name override, or None to auto-generate
+
+    Returns:
+        ExtensionNames: Dictionary with all name variants
+
+    Raises:
+        ExtensionNameError: If any name is invalid
+    """
+    publisher_camel, publisher_snake = _check_publisher(publisher)
+    return _build_extension_names(
+        display_name, publisher, publisher_camel, publisher_snake, technical_name
+    )
+
+
+def generate_extension_names_many(
+    display_names: Iterable[str], publisher: str
+) -> list[ExtensionNames]:
+    """
+    Generate name variants for several extensions from the same publisher.
+
+    The publisher is validated and converted once, and technical names are
+    derived from each display name.
+
+    Args:
+        display_names: Human-readable names (e.g., ["Dashboard Widgets"])
+        publisher: Publisher namespace shared by all extensions (e.g., "my-org")
+
+    Returns:
+        List of ExtensionNames, in the order of display_names
+
+    Raises:
+        ExtensionNameError: If the publisher or any display name is invalid
+    """
+    publisher_camel, publisher_snake = _check_publisher(publisher)
+    return [
+        _build_extension_names(
+            display_name, publisher, publisher_camel, publisher_snake, None
+        )
+        for display_name in display_names
+    ]
@@ -19,12 +19,31 @@ from __future__ import annotations
 
 import json
 import os
+import shutil
 from pathlib import Path
 
 import pytest
 import tomli_w
 from click.testing import CliRunner
 
+import superset_extensions_cli
+from superset_extensions_cli.cli import app, validate_npm
+
+TEMPLATES_DIR = Path(superset_extensions_cli.__file__).parent / "templates"
+# Prompt answers for `init`, kept as bytes so CliRunner can use them as-is
+CLI_INPUT_BOTH = b"Test Extension\n\ntest-org\n0.1.0\nApache-2.0\ny\ny\n"
+CLI_INPUT_FRONTEND_ONLY = b"Test Extension\n\ntest-org\n0.1.0\nApache-2.0\ny\nn\n"
+CLI_INPUT_BACKEND_ONLY = b"Test Extension\n\ntest-org\n0.1.0\nApache-2.0\nn\ny\n"
+CLI_INPUT_NEITHER = b"Test Extension\n\ntest-org\n0.1.0\nApache-2.0\nn\nn\n"
+
+
+@pytest.fixture(autouse=True)
+def reset_validate_npm_cache():
+    """Make every test run the real npm check instead of a memoized result."""
+    validate_npm.cache_clear()
+    yield
+    validate_npm.cache_clear()
+
 
 @pytest.fixture
 def cli_runner():
@@ -44,6 +63,21 @@ def isolated_filesystem(tmp_path):
     os.chdir(original_cwd)
 
 
+@pytest.fixture
+def fake_filesystem(fs):
+    """
+    Provide an empty in-memory working directory.
+
+    The bundled templates are mapped in read-only so `init` can render them, and
+    everything a command writes stays in memory instead of hitting the disk.
+    """
+    fs.add_real_directory(TEMPLATES_DIR)
+    base_path = Path("/tmp/iso")
+    fs.create_dir(base_path)
+    os.chdir(base_path)
+    return base_path
+
+
 @pytest.fixture
 def extension_params():
     """Default parameters for extension creation."""
@@ -61,25 +95,58 @@ def extension_params():
 @pytest.fixture
 def cli_input_both():
     """CLI input for creating extension with both frontend and backend."""
-    return "Test Extension\n\ntest-org\n0.1.0\nApache-2.0\ny\ny\n"
+    return CLI_INPUT_BOTH
+
+
+@pytest.fixture(scope="session")
+def golden_init_both(tmp_path_factory):
+    """
+    Run `init` with `CLI_INPUT_BOTH` once per session.
+
+    Returns the generated extension directory and the command output. Tests must
+    not modify the directory; use `golden_extension` to get a private copy.
+    """
+    base_path = tmp_path_factory.mktemp("golden")
+    original_cwd = Path.cwd()
+    os.chdir(base_path)
+    try:
+        result = CliRunner().invoke(app, ["init"], input=CLI_INPUT_BOTH)
+    finally:
+        os.chdir(original_cwd)
+
+    assert result.exit_code == 0, f"Command failed with output: {result.output}"
+    return base_path / "test-extension", result.output
+
+
+@pytest.fixture
+def golden_extension(tmp_path, golden_init_both):
+    """
+    Provide a copy of the extension created by `init` with `CLI_INPUT_BOTH`.
+
+    Returns the path of the copied extension directory and the `init` output.
+    """
+    source_path, output = golden_init_both
+    extension_path = tmp_path / source_path.name
+    shutil.copytree(source_path, extension_path)
+    return extension_path, output
 
 
 @pytest.fixture
 def cli_input_frontend_only():
     """CLI input for creating extension with frontend only."""
-    return "Test Extension\n\ntest-org\n0.1.0\nApache-2.0\ny\nn\n"
+    return CLI_INPUT_FRONTEND_ONLY
 
 
 @pytest.fixture
 def cli_input_backend_only():
     """CLI input for creating extension with backend only."""
-    return "Test Extension\n\ntest-org\n0.1.0\nApache-2.0\nn\ny\n"
+    return CLI_INPUT_BACKEND_ONLY
 
 
 @pytest.fixture
 def cli_input_neither():
     """CLI input for creating extension with neither frontend nor backend."""
-    return "Test Extension\n\ntest-org\n0.1.0\nApache-2.0\nn\nn\n"
+    return CLI_INPUT_NEITHER
 
 
 @pytest.fixture
@@ -18,10 +18,13 @@
 from __future__ import annotations
 
 import json
+import os
+from pathlib import Path
 from unittest.mock import Mock, patch
 
 import click
 import pytest
+import tomli_w
 from superset_extensions_cli.cli import (
     app,
     build_manifest,
@@ -29,6 +32,10 @@ from superset_extensions_cli.cli import (
     copy_backend_files,
     copy_frontend_dist,
     init_frontend_deps,
+    is_remote_entry,
+    load_extension_config,
+    plan_backend_copies,
+    walk_files,
 )
 
 from tests.utils import (
@@ -344,6 +351,88 @@ def test_build_manifest_exits_when_extension_json_missing(isolated_filesystem):
     assert exc_info.value.code == 1
 
 
+@pytest.mark.unit
+def test_load_extension_config_reuses_parsed_config_until_file_changes(
+    isolated_filesystem,
+):
+    """Test load_extension_config caches the config and picks up file changes."""
+    extension_data = {
+        "publisher": "test-org",
+        "name": "test-extension",
+        "displayName": "Test Extension",
+        "version": "1.0.0",
+        "permissions": [],
+    }
+    extension_json = isolated_filesystem / "extension.json"
+    extension_json.write_text(json.dumps(extension_data))
+
+    first = load_extension_config(isolated_filesystem)
+    assert first is not None
+    assert load_extension_config(isolated_filesystem) is first
+
+    extension_data["version"] = "1.0.10"
+    extension_json.write_text(json.dumps(extension_data))
+
+    updated = load_extension_config(isolated_filesystem)
+    assert updated is not None
+    assert updated.version == "1.0.10"
+
+
+@pytest.mark.unit
+def test_load_extension_config_picks_up_edit_with_same_size_and_mtime(
+    isolated_filesystem,
+):
+    """Test load_extension_config is not fooled by an unchanged size and mtime."""
+    extension_json = isolated_filesystem / "extension.json"
+    extension_json.write_text(
+        json.dumps(
+            {
+                "publisher": "test-org",
+                "name": "test-extension",
+                "displayName": "Test Extension",
+                "version": "1.0.0",
+                "permissions": [],
+            }
+        )
+    )
+    st = extension_json.stat()
+    assert load_extension_config(isolated_filesystem).version == "1.0.0"
+
+    extension_json.write_text(
+        json.dumps(
+            {
+                "publisher": "test-org",
+                "name": "test-extension",
+                "displayName": "Test Extension",
+                "version": "1.0.1",
+                "permissions": [],
+            }
+        )
+    )
+    os.utime(extension_json, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert extension_json.stat().st_size == st.st_size
+
+    assert load_extension_config(isolated_filesystem).version == "1.0.1"
+
+
+@pytest.mark.unit
+def test_load_extension_config_returns_none_when_missing(isolated_filesystem):
+    """Test load_extension_config returns None when extension.json is missing."""
+    assert load_extension_config(isolated_filesystem) is None
+
+
+@pytest.mark.unit
+def test_load_extension_config_empty_object_and_empty_file(isolated_filesystem):
+    """Test an empty JSON object loads as None while an empty file is invalid."""
+    extension_json = isolated_filesystem / "extension.json"
+    extension_json.write_text("{}")
+    assert load_extension_config(isolated_filesystem) is None
+
+    extension_json.write_text("")
+    with pytest.raises(json.JSONDecodeError):
+        load_extension_config(isolated_filesystem)
+
+
 # Frontend Build Tests
 @pytest.mark.unit
 def test_clean_dist_frontend_removes_frontend_dist(isolated_filesystem):
@@ -780,7 +869,62 @@ exclude = []
 # - test_copy_backend_files_exits_when_extension_json_missing: Validation catches this before copy_backend_files is called
 
 
+@pytest.mark.unit
+def test_plan_backend_copies_deduplicates_overlapping_patterns(isolated_filesystem):
+    """Test files matched by several include patterns are only copied once."""
+    backend_dir = isolated_filesystem / "backend"
+    src_dir = backend_dir / "src" / "test_org" / "test_ext"
+    src_dir.mkdir(parents=True)
+    (src_dir / "__init__.py").write_text("# init")
+    (src_dir / "main.py").write_text("# main")
+
+    pyproject = {
+        "tool": {
+            "apache_superset_extensions": {
+                "build": {
+                    "include": [
+                        "src/**/*.py",
+                        "src/test_org/**/*",
+                        "src/test_org/test_ext/main.py",
+                    ]
+                }
+            }
+        }
+    }
+    (backend_dir / "pyproject.toml").write_text(tomli_w.dumps(pyproject))
+
+    copies = plan_backend_copies(isolated_filesystem)
+
+    targets = [tgt.relative_to(isolated_filesystem).as_posix() for _, tgt in copies]
+    assert sorted(targets) == [
+        "dist/backend/src/test_org/test_ext/__init__.py",
+        "dist/backend/src/test_org/test_ext/main.py",
+    ]
+
+
 # Frontend Dist Copy Tests
+@pytest.mark.unit
+def test_walk_files_yields_nested_files(isolated_filesystem):
+    """Test walk_files yields files from all subdirectories but not directories."""
+    root = isolated_filesystem / "root"
+    (root / "a" / "b").mkdir(parents=True)
+    (root / "top.js").write_text("top")
+    (root / "a" / "mid.js").write_text("mid")
+    (root / "a" / "b" / "deep.js").write_text("deep")
+
+    paths = {
+        Path(entry.path).relative_to(root).as_posix() for entry in walk_files(root)
+    }
+
+    assert paths == {"top.js", "a/mid.js", "a/b/deep.js"}
+
+
+@pytest.mark.unit
+def test_walk_files_with_missing_root(isolated_filesystem):
+    """Test walk_files yields nothing when the root directory doesn't exist."""
+    assert list(walk_files(isolated_filesystem / "missing")) == []
+
+
 @pytest.mark.unit
 def test_copy_frontend_dist_copies_files_correctly(isolated_filesystem):
     """Test copy_frontend_dist copies frontend build files to dist."""
@@ -811,6 +955,23 @@ def test_copy_frontend_dist_copies_files_correctly(isolated_filesystem):
     assert_file_exists(dist_dir / "frontend" / "dist" / "assets" / "style.css")
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "filename,expected",
+    [
+        ("remoteEntry.abc123.js", True),
+        ("remoteEntry.a.js", True),
+        ("remoteEntry.js", False),
+        ("remoteEntry.abc123.js.map", False),
+        ("main.remoteEntry.abc123.js", False),
+        ("remoteentry.abc123.js", False),
+    ],
+)
+def test_is_remote_entry(filename, expected):
+    """Test is_remote_entry only matches remoteEntry.<hash>.js files."""
+    assert is_remote_entry(filename) is expected
+
+
 @pytest.mark.unit
 def test_copy_frontend_dist_exits_when_no_remote_entry(isolated_filesystem):
     """Test copy_frontend_dist exits when no remoteEntry file found."""
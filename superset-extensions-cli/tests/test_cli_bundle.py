@@ -57,6 +57,10 @@ def test_bundle_command_creates_zip_with_default_name(
         assert "frontend/dist/main.js" in file_list
         assert "backend/src/test_org/test_extension/__init__.py" in file_list
 
+        # Verify file contents were streamed intact
+        assert zipf.read("frontend/dist/main.js") == b"// main js"
+        assert zipf.testzip() is None
+
 
 @pytest.mark.cli
 @patch("superset_extensions_cli.cli.build")
@@ -214,6 +218,12 @@ def test_bundle_includes_all_files_recursively(
             f"Missing files: {expected_files - file_list}"
         )
 
+        # Already-compressed assets are stored, everything else is deflated
+        compress_types = {info.filename: info.compress_type for info in zipf.infolist()}
+        assert compress_types["frontend/dist/assets/image.png"] == zipfile.ZIP_STORED
+        assert compress_types["frontend/dist/assets/style.css"] == zipfile.ZIP_DEFLATED
+        assert compress_types["manifest.json"] == zipfile.ZIP_DEFLATED
+
 
 @pytest.mark.cli
 @patch("superset_extensions_cli.cli.build")
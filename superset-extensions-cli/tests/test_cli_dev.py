@@ -18,18 +18,26 @@
 from __future__ import annotations
 
 import json
+import os
+import signal
+import sys
 import threading
 import time
 from unittest.mock import Mock, patch
 
 import pytest
 from superset_core.extensions.types import Manifest
-from superset_extensions_cli.cli import app, FrontendChangeHandler
+from superset_extensions_cli.cli import (
+    app,
+    DebouncedChangeHandler,
+    FrontendChangeHandler,
+    wait_for_interrupt,
+)
 
 
 # Dev Command Tests
 @pytest.mark.cli
-@patch("superset_extensions_cli.cli.Observer")
+@patch("watchdog.observers.Observer")
 @patch("superset_extensions_cli.cli.init_frontend_deps")
 @patch("superset_extensions_cli.cli.rebuild_frontend")
 @patch("superset_extensions_cli.cli.rebuild_backend")
@@ -117,15 +125,15 @@ def test_dev_command_initial_build(
 
     extension_setup_for_dev(isolated_filesystem)
 
-    with patch("superset_extensions_cli.cli.Observer") as mock_observer_class:
+    with patch("watchdog.observers.Observer") as mock_observer_class:
         mock_observer = Mock()
         mock_observer_class.return_value = mock_observer
 
-        with patch("time.sleep", side_effect=KeyboardInterrupt):
-            try:
-                cli_runner.invoke(app, ["dev"], catch_exceptions=False)
-            except KeyboardInterrupt:
-                pass
+        with patch("superset_extensions_cli.cli.wait_for_interrupt"):
+            cli_runner.invoke(app, ["dev"], catch_exceptions=False)
+
+        mock_observer.stop.assert_called_once()
+        mock_observer.join.assert_called_once()
 
     # Verify initial build steps
     frontend_dir = isolated_filesystem / "frontend"
@@ -134,6 +142,61 @@ def test_dev_command_initial_build(
     mock_rebuild_backend.assert_called_once_with(isolated_filesystem)
 
 
+@pytest.mark.cli
+@patch("superset_extensions_cli.cli.init_frontend_deps")
+@patch("superset_extensions_cli.cli.rebuild_frontend")
+@patch("superset_extensions_cli.cli.rebuild_backend")
+@patch("superset_extensions_cli.cli.FrontendChangeHandler")
+def test_dev_frontend_rebuild_reuses_manifest(
+    mock_handler_class,
+    mock_rebuild_backend,
+    mock_rebuild_frontend,
+    mock_init_frontend_deps,
+    cli_runner,
+    isolated_filesystem,
+    extension_setup_for_dev,
+):
+    """Test frontend rebuilds only update the remote entry of the initial manifest."""
+    from superset_extensions_cli.cli import build_manifest
+
+    mock_rebuild_frontend.side_effect = [
+        "remoteEntry.first.js",
+        "remoteEntry.second.js",
+    ]
+    extension_setup_for_dev(isolated_filesystem)
+
+    with (
+        patch("watchdog.observers.Observer"),
+        patch("superset_extensions_cli.cli.wait_for_interrupt"),
+        patch(
+            "superset_extensions_cli.cli.build_manifest", wraps=build_manifest
+        ) as mock_build_manifest,
+    ):
+        cli_runner.invoke(app, ["dev"], catch_exceptions=False)
+
+        # Simulate a frontend change once watch mode is set up
+        trigger_build = mock_handler_class.call_args.kwargs["trigger_build"]
+        trigger_build()
+
+    mock_build_manifest.assert_called_once()
+    manifest = json.loads((isolated_filesystem / "dist" / "manifest.json").read_text())
+    assert manifest["frontend"]["remoteEntry"] == "remoteEntry.second.js"
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX signal delivery")
+def test_wait_for_interrupt_returns_on_sigint():
+    """Test wait_for_interrupt returns on SIGINT and restores the previous handler."""
+    previous_handler = signal.getsignal(signal.SIGINT)
+    timer = threading.Timer(0.05, os.kill, args=(os.getpid(), signal.SIGINT))
+    timer.start()
+
+    wait_for_interrupt()
+
+    timer.join()
+    assert signal.getsignal(signal.SIGINT) is previous_handler
+
+
 # FrontendChangeHandler Tests
 @pytest.mark.unit
 def test_frontend_change_handler_init():
@@ -171,8 +234,9 @@ def test_frontend_change_handler_ignores_dist_changes():
 )
 def test_frontend_change_handler_triggers_on_source_changes(source_path):
     """Test FrontendChangeHandler triggers build on source changes."""
-    mock_trigger = Mock()
-    handler = FrontendChangeHandler(trigger_build=mock_trigger)
+    triggered = threading.Event()
+    mock_trigger = Mock(side_effect=triggered.set)
+    handler = FrontendChangeHandler(trigger_build=mock_trigger, debounce_seconds=0)
 
     # Create mock event with source path
     mock_event = Mock()
@@ -181,9 +245,100 @@ def test_frontend_change_handler_triggers_on_source_changes(source_path):
     handler.on_any_event(mock_event)
 
     # Should trigger build for source changes
+    assert triggered.wait(timeout=5)
+    mock_trigger.assert_called_once()
+
+
+@pytest.mark.unit
+def test_frontend_change_handler_debounces_event_bursts():
+    """Test FrontendChangeHandler triggers a single build for a burst of events."""
+    triggered = threading.Event()
+    mock_trigger = Mock(side_effect=triggered.set)
+    handler = FrontendChangeHandler(trigger_build=mock_trigger, debounce_seconds=0.1)
+
+    mock_event = Mock()
+    mock_event.src_path = "/path/to/frontend/src/component.tsx"
+
+    for _ in range(5):
+        handler.on_any_event(mock_event)
+
+    assert triggered.wait(timeout=5)
+    # Give any extra (incorrectly scheduled) builds time to fire
+    time.sleep(0.2)
     mock_trigger.assert_called_once()
 
 
+@pytest.mark.unit
+def test_debounced_handler_coalesces_triggers_during_a_build():
+    """Test triggers during a running build queue exactly one follow-up build."""
+    first_started = threading.Event()
+    release_first = threading.Event()
+    second_finished = threading.Event()
+    state_lock = threading.Lock()
+    calls = 0
+    running = 0
+    max_running = 0
+
+    def build():
+        nonlocal calls, running, max_running
+        with state_lock:
+            calls += 1
+            call = calls
+            running += 1
+            max_running = max(max_running, running)
+        if call == 1:
+            first_started.set()
+            release_first.wait(timeout=5)
+        with state_lock:
+            running -= 1
+        if call == 2:
+            second_finished.set()
+
+    handler = DebouncedChangeHandler(trigger_build=build, debounce_seconds=0)
+
+    handler.schedule_build()
+    assert first_started.wait(timeout=5)
+    for _ in range(3):
+        handler.schedule_build()
+    # Let those timers fire while the first build is still running
+    time.sleep(0.1)
+    release_first.set()
+
+    assert second_finished.wait(timeout=5)
+    # Give any extra (incorrectly scheduled) builds time to fire
+    time.sleep(0.1)
+    assert max_running == 1
+    assert calls == 2
+
+
+@pytest.mark.unit
+def test_debounced_handlers_sharing_a_lock_never_build_concurrently():
+    """Test handlers sharing a build lock run their builds one at a time."""
+    build_lock = threading.Lock()
+    frontend_started = threading.Event()
+    release_frontend = threading.Event()
+    backend_started = threading.Event()
+
+    def frontend_build():
+        frontend_started.set()
+        release_frontend.wait(timeout=5)
+
+    frontend_handler = DebouncedChangeHandler(
+        trigger_build=frontend_build, debounce_seconds=0, build_lock=build_lock
+    )
+    backend_handler = DebouncedChangeHandler(
+        trigger_build=backend_started.set, debounce_seconds=0, build_lock=build_lock
+    )
+
+    frontend_handler.schedule_build()
+    assert frontend_started.wait(timeout=5)
+    backend_handler.schedule_build()
+
+    assert not backend_started.wait(timeout=0.1)
+    release_frontend.set()
+    assert backend_started.wait(timeout=5)
+
+
 # Dev Utility Functions Tests
 @pytest.mark.unit
 def test_frontend_watcher_function_coverage(isolated_filesystem):
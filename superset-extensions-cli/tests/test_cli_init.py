@@ -17,8 +17,6 @@
 
 from __future__ import annotations
 
-from pathlib import Path
-
 import pytest
 from superset_extensions_cli.cli import app
 
@@ -28,31 +26,45 @@ from tests.utils import (
     assert_file_exists,
     assert_file_structure,
     assert_json_content,
+    assert_json_file,
+    assert_output_contains_all,
     create_test_extension_structure,
     load_json_file,
 )
 
+# Options for a non-interactive init; add --[no-]frontend/--[no-]backend as needed
+INIT_OPTIONS = [
+    "init",
+    "--publisher",
+    "test-org",
+    "--name",
+    "test-extension",
+    "--display-name",
+    "Test Extension",
+    "--version",
+    "0.1.0",
+    "--license",
+    "Apache-2.0",
+]
+CLI_INPUT_AWESOME_CHARTS = b"Awesome Charts\n\nawesome-org\n1.0.0\nApache-2.0\ny\ny\n"
+
 
 # Init Command Tests
 @pytest.mark.cli
-def test_init_creates_extension_with_both_frontend_and_backend(
-    cli_runner, isolated_filesystem, cli_input_both
-):
+def test_init_creates_extension_with_both_frontend_and_backend(golden_extension):
     """Test that init creates a complete extension with both frontend and backend."""
-    result = cli_runner.invoke(app, ["init"], input=cli_input_both)
+    extension_path, output = golden_extension
 
-    assert result.exit_code == 0, f"Command failed with output: {result.output}"
     assert (
         "🎉 Extension Test Extension (ID: test-org.test-extension) initialized"
-        in result.output
+        in output
     )
 
     # Verify directory structure
-    extension_path = isolated_filesystem / "test-extension"
     assert_directory_exists(extension_path, "main extension directory")
 
     expected_structure = create_test_extension_structure(
-        isolated_filesystem,
+        extension_path.parent,
         "test-extension",
         include_frontend=True,
         include_backend=True,
@@ -66,15 +78,13 @@ def test_init_creates_extension_with_both_frontend_and_backend(
 
 
 @pytest.mark.cli
-def test_init_creates_extension_with_frontend_only(
-    cli_runner, isolated_filesystem, cli_input_frontend_only
-):
+def test_init_creates_extension_with_frontend_only(cli_runner, fake_filesystem):
     """Test that init creates extension with only frontend components."""
-    result = cli_runner.invoke(app, ["init"], input=cli_input_frontend_only)
+    result = cli_runner.invoke(app, [*INIT_OPTIONS, "--frontend", "--no-backend"])
 
     assert result.exit_code == 0, f"Command failed with output: {result.output}"
 
-    extension_path = isolated_filesystem / "test-extension"
+    extension_path = fake_filesystem / "test-extension"
     assert_directory_exists(extension_path)
 
     # Should have frontend directory and package.json
@@ -89,15 +99,13 @@ def test_init_creates_extension_with_frontend_only(
 
 
 @pytest.mark.cli
-def test_init_creates_extension_with_backend_only(
-    cli_runner, isolated_filesystem, cli_input_backend_only
-):
+def test_init_creates_extension_with_backend_only(cli_runner, fake_filesystem):
     """Test that init creates extension with only backend components."""
-    result = cli_runner.invoke(app, ["init"], input=cli_input_backend_only)
+    result = cli_runner.invoke(app, [*INIT_OPTIONS, "--no-frontend", "--backend"])
 
     assert result.exit_code == 0, f"Command failed with output: {result.output}"
 
-    extension_path = isolated_filesystem / "test-extension"
+    extension_path = fake_filesystem / "test-extension"
     assert_directory_exists(extension_path)
 
     # Should have backend directory and pyproject.toml
@@ -113,14 +121,14 @@ def test_init_creates_extension_with_backend_only(
 
 @pytest.mark.cli
 def test_init_creates_extension_with_neither_frontend_nor_backend(
-    cli_runner, isolated_filesystem, cli_input_neither
+    cli_runner, fake_filesystem
 ):
     """Test that init creates minimal extension with neither frontend nor backend."""
-    result = cli_runner.invoke(app, ["init"], input=cli_input_neither)
+    result = cli_runner.invoke(app, [*INIT_OPTIONS, "--no-frontend", "--no-backend"])
 
     assert result.exit_code == 0, f"Command failed with output: {result.output}"
 
-    extension_path = isolated_filesystem / "test-extension"
+    extension_path = fake_filesystem / "test-extension"
     assert_directory_exists(extension_path)
 
     # Should only have extension.json
@@ -131,30 +139,6 @@ def test_init_creates_extension_with_neither_frontend_nor_backend(
     assert not (extension_path / "backend").exists()
 
 
-@pytest.mark.cli
-def test_init_accepts_valid_display_name(cli_runner, isolated_filesystem):
-    """Test that init accepts valid display names and generates proper ID."""
-    cli_input = "My Awesome Extension\n\ntest-org\n0.1.0\nApache-2.0\ny\ny\n"
-    result = cli_runner.invoke(app, ["init"], input=cli_input)
-
-    assert result.exit_code == 0, f"Should accept display name: {result.output}"
-    assert Path("my-awesome-extension").exists(), (
-        "Directory with extension name should be created"
-    )
-
-
-@pytest.mark.cli
-def test_init_accepts_mixed_alphanumeric_name(cli_runner, isolated_filesystem):
-    """Test that init accepts mixed alphanumeric display names."""
-    cli_input = "Tool 123\n\ntest-org\n0.1.0\nApache-2.0\ny\ny\n"
-    result = cli_runner.invoke(app, ["init"], input=cli_input)
-
-    assert result.exit_code == 0, (
-        f"Mixed alphanumeric display name should be valid: {result.output}"
-    )
-    assert Path("tool-123").exists(), "Directory for 'tool-123' should be created"
-
-
 @pytest.mark.cli
 @pytest.mark.parametrize(
     "display_name,expected_dir",
@@ -164,49 +148,42 @@ def test_init_accepts_mixed_alphanumeric_name(cli_runner, isolated_filesystem):
         ("Dashboard Helper", "dashboard-helper"),
         ("Chart Builder Pro", "chart-builder-pro"),
     ],
+    ids=["two-words", "trailing-version", "dashboard-helper", "three-words"],
 )
-def test_init_with_various_display_names(cli_runner, display_name, expected_dir):
+def test_init_with_various_display_names(
+    cli_runner, isolated_filesystem, display_name, expected_dir
+):
     """Test that init accepts various display names and creates directory named after extension."""
-    with cli_runner.isolated_filesystem():
-        cli_input = f"{display_name}\n\ntest-org\n0.1.0\nApache-2.0\ny\ny\n"
-        result = cli_runner.invoke(app, ["init"], input=cli_input)
+    cli_input = f"{display_name}\n\ntest-org\n0.1.0\nApache-2.0\ny\ny\n"
+    result = cli_runner.invoke(app, ["init"], input=cli_input)
 
-        assert result.exit_code == 0, (
-            f"Valid display name '{display_name}' was rejected: {result.output}"
-        )
-        assert Path(expected_dir).exists(), (
-            f"Directory '{expected_dir}' was not created"
-        )
+    assert result.exit_code == 0, (
+        f"Valid display name '{display_name}' was rejected: {result.output}"
+    )
+    assert (isolated_filesystem / expected_dir).exists()
 
 
 @pytest.mark.cli
-def test_init_fails_when_directory_already_exists(
-    cli_runner, isolated_filesystem, cli_input_both
-):
+def test_init_fails_when_directory_already_exists(cli_runner, isolated_filesystem):
     """Test that init fails gracefully when target directory already exists."""
     # Create the directory first
     existing_dir = isolated_filesystem / "test-extension"
     existing_dir.mkdir()
 
-    result = cli_runner.invoke(app, ["init"], input=cli_input_both)
+    result = cli_runner.invoke(app, [*INIT_OPTIONS, "--frontend", "--backend"])
 
     assert result.exit_code == 1, "Command should fail when directory already exists"
     assert "already exists" in result.output
 
 
 @pytest.mark.cli
-def test_extension_json_content_is_correct(
-    cli_runner, isolated_filesystem, cli_input_both
-):
+def test_extension_json_content_is_correct(golden_extension):
     """Test that the generated extension.json has the correct content."""
-    result = cli_runner.invoke(app, ["init"], input=cli_input_both)
-    assert result.exit_code == 0
-
-    extension_path = isolated_filesystem / "test-extension"
+    extension_path, _ = golden_extension
     extension_json_path = extension_path / "extension.json"
 
     # Verify the JSON structure and values
-    assert_json_content(
+    content = assert_json_file(
         extension_json_path,
         {
             "publisher": "test-org",
@@ -218,9 +195,6 @@ def test_extension_json_content_is_correct(
         },
     )
 
-    # Load and verify more complex nested structures
-    content = load_json_file(extension_json_path)
-
     # Verify frontend section is not present (contributions are code-first)
     assert "frontend" not in content
 
@@ -229,18 +203,13 @@ def test_extension_json_content_is_correct(
 
 
 @pytest.mark.cli
-def test_frontend_package_json_content_is_correct(
-    cli_runner, isolated_filesystem, cli_input_both
-):
+def test_frontend_package_json_content_is_correct(golden_extension):
     """Test that the generated frontend/package.json has the correct content."""
-    result = cli_runner.invoke(app, ["init"], input=cli_input_both)
-    assert result.exit_code == 0
-
-    extension_path = isolated_filesystem / "test-extension"
+    extension_path, _ = golden_extension
     package_json_path = extension_path / "frontend" / "package.json"
 
     # Verify the package.json structure and values
-    assert_json_content(
+    content = assert_json_file(
         package_json_path,
         {
             "name": "@test-org/test-extension",
@@ -250,7 +219,6 @@ def test_frontend_package_json_content_is_correct(
     )
 
     # Verify more complex structures
-    content = load_json_file(package_json_path)
     assert "scripts" in content
     assert "build" in content["scripts"]
     assert "peerDependencies" in content
@@ -258,14 +226,9 @@ def test_frontend_package_json_content_is_correct(
 
 
 @pytest.mark.cli
-def test_backend_pyproject_toml_is_created(
-    cli_runner, isolated_filesystem, cli_input_both
-):
+def test_backend_pyproject_toml_is_created(golden_extension):
     """Test that the generated backend/pyproject.toml file is created."""
-    result = cli_runner.invoke(app, ["init"], input=cli_input_both)
-    assert result.exit_code == 0
-
-    extension_path = isolated_filesystem / "test-extension"
+    extension_path, _ = golden_extension
     pyproject_path = extension_path / "backend" / "pyproject.toml"
 
     assert_file_exists(pyproject_path, "backend pyproject.toml")
@@ -280,30 +243,27 @@ def test_backend_pyproject_toml_is_created(
 
 
 @pytest.mark.cli
-def test_init_command_output_messages(cli_runner, isolated_filesystem, cli_input_both):
+def test_init_command_output_messages(golden_extension):
     """Test that init command produces expected output messages."""
-    result = cli_runner.invoke(app, ["init"], input=cli_input_both)
-
-    assert result.exit_code == 0
-    output = result.output
+    _, output = golden_extension
 
     # Check for expected success messages
-    assert "Created extension.json" in output
-    assert "Created .gitignore" in output
-    assert "Created frontend folder structure" in output
-    assert "Created backend folder structure" in output
-    assert (
-        "Extension Test Extension (ID: test-org.test-extension) initialized" in output
+    assert_output_contains_all(
+        output,
+        [
+            "Created extension.json",
+            "Created .gitignore",
+            "Created frontend folder structure",
+            "Created backend folder structure",
+            "Extension Test Extension (ID: test-org.test-extension) initialized",
+        ],
     )
 
 
 @pytest.mark.cli
-def test_gitignore_content_is_correct(cli_runner, isolated_filesystem, cli_input_both):
+def test_gitignore_content_is_correct(golden_extension):
     """Test that the generated .gitignore has the correct content."""
-    result = cli_runner.invoke(app, ["init"], input=cli_input_both)
-    assert result.exit_code == 0
-
-    extension_path = isolated_filesystem / "test-extension"
+    extension_path, _ = golden_extension
     gitignore_path = extension_path / ".gitignore"
 
     assert_file_exists(gitignore_path, ".gitignore")
@@ -321,14 +281,30 @@ def test_gitignore_content_is_correct(cli_runner, isolated_filesystem, cli_input
 
 
 @pytest.mark.cli
-def test_init_with_custom_version_and_license(cli_runner, isolated_filesystem):
+def test_init_with_custom_version_and_license(cli_runner, fake_filesystem):
     """Test init with custom version and license parameters."""
-    cli_input = "My Extension\n\ntest-org\n2.1.0\nMIT\ny\nn\n"
-    result = cli_runner.invoke(app, ["init"], input=cli_input)
+    result = cli_runner.invoke(
+        app,
+        [
+            "init",
+            "--publisher",
+            "test-org",
+            "--name",
+            "my-extension",
+            "--display-name",
+            "My Extension",
+            "--version",
+            "2.1.0",
+            "--license",
+            "MIT",
+            "--frontend",
+            "--no-backend",
+        ],
+    )
 
     assert result.exit_code == 0
 
-    extension_path = isolated_filesystem / "my-extension"
+    extension_path = fake_filesystem / "my-extension"
     extension_json_path = extension_path / "extension.json"
 
     assert_json_content(
@@ -347,12 +323,11 @@ def test_init_with_custom_version_and_license(cli_runner, isolated_filesystem):
 @pytest.mark.cli
 def test_full_init_workflow_integration(cli_runner, isolated_filesystem):
     """Integration test for the complete init workflow."""
-    # Test the complete flow with realistic user input
-    cli_input = "Awesome Charts\n\nawesome-org\n1.0.0\nApache-2.0\ny\ny\n"
-    result = cli_runner.invoke(app, ["init"], input=cli_input)
+    # Test the complete flow with realistic user input on the real filesystem
+    result = cli_runner.invoke(app, ["init"], input=CLI_INPUT_AWESOME_CHARTS)
 
     # Verify success
-    assert result.exit_code == 0
+    assert result.exit_code == 0, f"Command failed with output: {result.output}"
 
     # Verify complete directory structure
     extension_path = isolated_filesystem / "awesome-charts"
@@ -362,8 +337,6 @@ def test_full_init_workflow_integration(cli_runner, isolated_filesystem):
         include_frontend=True,
         include_backend=True,
     )
-
-    # Comprehensive structure verification
     assert_directory_structure(extension_path, expected_structure["expected_dirs"])
     assert_file_structure(extension_path, expected_structure["expected_files"])
 
@@ -386,7 +359,7 @@ def test_full_init_workflow_integration(cli_runner, isolated_filesystem):
 
 # Non-interactive mode tests
 @pytest.mark.cli
-def test_init_non_interactive_with_all_options(cli_runner, isolated_filesystem):
+def test_init_non_interactive_with_all_options(cli_runner, fake_filesystem):
     """Test that init works in non-interactive mode with all CLI options."""
     result = cli_runner.invoke(
         app,
@@ -410,7 +383,7 @@ def test_init_non_interactive_with_all_options(cli_runner, isolated_filesystem):
     assert result.exit_code == 0, f"Command failed with output: {result.output}"
     assert "🎉 Extension My Extension (ID: my-org.my-ext) initialized" in result.output
 
-    extension_path = isolated_filesystem / "my-ext"
+    extension_path = fake_filesystem / "my-ext"
     assert_directory_exists(extension_path)
     assert_directory_exists(extension_path / "frontend")
     assert_directory_exists(extension_path / "backend")
@@ -424,7 +397,7 @@ def test_init_non_interactive_with_all_options(cli_runner, isolated_filesystem):
 
 
 @pytest.mark.cli
-def test_init_frontend_only_with_cli_options(cli_runner, isolated_filesystem):
+def test_init_frontend_only_with_cli_options(cli_runner, fake_filesystem):
     """Test init with frontend only using CLI options."""
     result = cli_runner.invoke(
         app,
@@ -447,13 +420,13 @@ def test_init_frontend_only_with_cli_options(cli_runner, isolated_filesystem):
 
     assert result.exit_code == 0, f"Command failed with output: {result.output}"
 
-    extension_path = isolated_filesystem / "frontend-ext"
+    extension_path = fake_filesystem / "frontend-ext"
     assert_directory_exists(extension_path / "frontend")
     assert not (extension_path / "backend").exists()
 
 
 @pytest.mark.cli
-def test_init_backend_only_with_cli_options(cli_runner, isolated_filesystem):
+def test_init_backend_only_with_cli_options(cli_runner, fake_filesystem):
     """Test init with backend only using CLI options."""
     result = cli_runner.invoke(
         app,
@@ -476,13 +449,13 @@ def test_init_backend_only_with_cli_options(cli_runner, isolated_filesystem):
 
     assert result.exit_code == 0, f"Command failed with output: {result.output}"
 
-    extension_path = isolated_filesystem / "backend-ext"
+    extension_path = fake_filesystem / "backend-ext"
     assert not (extension_path / "frontend").exists()
     assert_directory_exists(extension_path / "backend")
 
 
 @pytest.mark.cli
-def test_init_prompts_for_missing_options(cli_runner, isolated_filesystem):
+def test_init_prompts_for_missing_options(cli_runner, fake_filesystem):
     """Test that init prompts for options not provided via CLI and uses defaults."""
     # Provide publisher, name, and display-name via CLI, but version/license will be prompted (accept defaults)
     result = cli_runner.invoke(
@@ -503,7 +476,7 @@ def test_init_prompts_for_missing_options(cli_runner, isolated_filesystem):
 
     assert result.exit_code == 0, f"Command failed with output: {result.output}"
 
-    extension_path = isolated_filesystem / "default-ext"
+    extension_path = fake_filesystem / "default-ext"
     extension_json = load_json_file(extension_path / "extension.json")
     assert extension_json["version"] == "0.1.0"
     assert extension_json["license"] == "Apache-2.0"
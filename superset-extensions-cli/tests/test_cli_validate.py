@@ -117,6 +117,20 @@ def test_validate_npm_succeeds_with_valid_versions(mock_run, mock_which, npm_ver
     validate_npm()
 
 
+@pytest.mark.unit
+@patch("shutil.which")
+@patch("subprocess.run")
+def test_validate_npm_caches_successful_check(mock_run, mock_which):
+    """Test validate_npm only runs `npm -v` once per process after succeeding."""
+    mock_which.return_value = "/usr/bin/npm"
+    mock_run.return_value = Mock(returncode=0, stdout="10.8.2\n", stderr="")
+
+    validate_npm()
+    validate_npm()
+
+    mock_run.assert_called_once()
+
+
 @pytest.mark.unit
 @pytest.mark.parametrize(
     "npm_version,should_pass",
@@ -124,6 +138,8 @@ def test_validate_npm_succeeds_with_valid_versions(mock_run, mock_which, npm_ver
         ("10.8.2", True),  # Exact minimum version
         ("10.8.1", False),  # Slightly lower version
         ("10.9.0-alpha.1", True),  # Pre-release version higher than minimum
+        ("10.8.2-alpha.1", False),  # Pre-release of the minimum version
+        ("10.10.0", True),  # Minor version compared numerically, not lexically
         ("9.9.9", False),  # Much lower version
         ("11.0.0", True),  # Much higher version
     ],
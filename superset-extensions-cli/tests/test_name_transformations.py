@@ -20,6 +20,7 @@ import pytest
 from superset_extensions_cli.exceptions import ExtensionNameError
 from superset_extensions_cli.utils import (
     generate_extension_names,
+    generate_extension_names_many,
     get_module_federation_name,
     kebab_to_camel_case,
     kebab_to_snake_case,
@@ -32,6 +33,11 @@ from superset_extensions_cli.utils import (
     validate_technical_name,
 )
 
+# Publisher used throughout, with its snake_case and camelCase forms
+TEST_PUBLISHER = "test-org"
+TEST_PUBLISHER_SNAKE = "test_org"
+TEST_PUBLISHER_CAMEL = "testOrg"
+
 
 # Name transformation tests
 
@@ -52,6 +58,8 @@ from superset_extensions_cli.utils import (
         ("  Hello World  ", "hello-world"),  # Trimmed
         ("API v2 Client", "api-v2-client"),  # Numbers preserved
         ("Simple", "simple"),  # Single word
+        ("Tab\tSeparated", "tab-separated"),  # Any whitespace separates words
+        ("Café Extension", "caf-extension"),  # Non-ASCII letters removed
     ],
 )
 def test_name_to_kebab_case(display_name, expected):
@@ -60,37 +68,21 @@ def test_name_to_kebab_case(display_name, expected):
 
 
 @pytest.mark.parametrize(
-    ("kebab_name", "expected"),
-    [
-        ("hello-world", "helloWorld"),
-        ("data-explorer", "dataExplorer"),
-        ("my-extension", "myExtension"),
-        ("api-v2-client", "apiV2Client"),
-        ("simple", "simple"),  # Single word
-        ("chart-tool", "chartTool"),
-        ("dashboard-helper", "dashboardHelper"),
-    ],
-)
-def test_kebab_to_camel_case(kebab_name, expected):
-    """Test kebab-case to camelCase conversion."""
-    assert kebab_to_camel_case(kebab_name) == expected
-
-
-@pytest.mark.parametrize(
-    ("kebab_name", "expected"),
+    ("kebab_name", "expected_snake", "expected_camel"),
     [
-        ("hello-world", "hello_world"),
-        ("data-explorer", "data_explorer"),
-        ("my-extension", "my_extension"),
-        ("api-v2-client", "api_v2_client"),
-        ("simple", "simple"),  # Single word
-        ("chart-tool", "chart_tool"),
-        ("dashboard-helper", "dashboard_helper"),
+        ("hello-world", "hello_world", "helloWorld"),
+        ("data-explorer", "data_explorer", "dataExplorer"),
+        ("my-extension", "my_extension", "myExtension"),
+        ("api-v2-client", "api_v2_client", "apiV2Client"),
+        ("simple", "simple", "simple"),  # Single word
+        ("chart-tool", "chart_tool", "chartTool"),
+        ("dashboard-helper", "dashboard_helper", "dashboardHelper"),
     ],
 )
-def test_kebab_to_snake_case(kebab_name, expected):
-    """Test kebab-case to snake_case conversion."""
-    assert kebab_to_snake_case(kebab_name) == expected
+def test_kebab_case_conversions(kebab_name, expected_snake, expected_camel):
+    """Test kebab-case to snake_case and camelCase conversion."""
+    assert kebab_to_snake_case(kebab_name) == expected_snake
+    assert kebab_to_camel_case(kebab_name) == expected_camel
 
 
 # Display name validation tests
@@ -187,6 +179,8 @@ def test_validate_python_package_name_keywords(keyword):
     ("invalid_package",),
     [
         ("hello-world",),  # Hyphens not allowed in Python identifiers
+        ("hello.world",),  # Dots not allowed in Python identifiers
+        ("hello world",),  # Spaces not allowed in Python identifiers
     ],
 )
 def test_validate_python_package_name_invalid(invalid_package):
@@ -195,6 +189,12 @@ def test_validate_python_package_name_invalid(invalid_package):
         validate_python_package_name(invalid_package)
 
 
+def test_validate_python_package_name_empty():
+    """Test empty Python package names are rejected."""
+    with pytest.raises(ExtensionNameError, match="cannot be empty"):
+        validate_python_package_name("")
+
+
 # NPM package validation tests
 
 
@@ -296,6 +296,10 @@ def test_validate_technical_name_valid(valid_name):
         ("-name", "must start with a letter and contain only lowercase letters"),
         ("name-", "must start with a letter and contain only lowercase letters"),
         ("na--me", "must start with a letter and contain only lowercase letters"),
+        (
+            "invalid_name",
+            "must start with a letter and contain only lowercase letters",
+        ),
     ],
 )
 def test_validate_technical_name_invalid(invalid_name, error_match):
@@ -315,6 +319,8 @@ def test_validate_technical_name_invalid(invalid_name, error_match):
         ("My@Tool#123", "mytool123"),
         ("  Spaced  Out  ", "spaced-out"),
         ("API v2 Client", "api-v2-client"),
+        ("My Awesome Extension", "my-awesome-extension"),
+        ("Tool 123", "tool-123"),
     ],
 )
 def test_suggest_technical_name(display_name, expected_technical):
@@ -340,47 +346,48 @@ def test_get_module_federation_name(publisher, name, expected_mf):
 # Complete name generation tests
 
 
+def _expected_names(display_name, kebab, snake, camel):
+    """Build the full name set generate_extension_names returns for TEST_PUBLISHER."""
+    return {
+        "display_name": display_name,
+        "publisher": TEST_PUBLISHER,
+        "name": kebab,  # Technical name
+        "id": f"{TEST_PUBLISHER}.{kebab}",  # Composite ID
+        "npm_name": f"@{TEST_PUBLISHER}/{kebab}",  # NPM scoped
+        # Module Federation with publisher prefix
+        "mf_name": f"{TEST_PUBLISHER_CAMEL}_{camel}",
+        "backend_package": f"{TEST_PUBLISHER_SNAKE}-{snake}",  # Collision-safe
+        "backend_path": f"{TEST_PUBLISHER_SNAKE}.{snake}",
+        "backend_entry": f"{TEST_PUBLISHER_SNAKE}.{snake}.entrypoint",
+    }
+
+
 @pytest.mark.parametrize(
-    ("display_name", "expected_kebab", "expected_snake", "expected_camel"),
+    ("display_name", "technical_name", "expected"),
     [
-        ("Hello World", "hello-world", "hello_world", "helloWorld"),
-        ("Data Explorer", "data-explorer", "data_explorer", "dataExplorer"),
-        ("My Extension v2", "my-extension-v2", "my_extension_v2", "myExtensionV2"),
-        ("Chart Tool", "chart-tool", "chart_tool", "chartTool"),
-        ("Simple", "simple", "simple", "simple"),
-        ("API v2 Client", "api-v2-client", "api_v2_client", "apiV2Client"),
-        (
-            "Dashboard Helper",
-            "dashboard-helper",
-            "dashboard_helper",
-            "dashboardHelper",
-        ),
+        (display, kebab, _expected_names(display, kebab, snake, camel))
+        for display, kebab, snake, camel in [
+            ("Hello World", "hello-world", "hello_world", "helloWorld"),
+            ("Data Explorer", "data-explorer", "data_explorer", "dataExplorer"),
+            ("My Extension v2", "my-extension-v2", "my_extension_v2", "myExtensionV2"),
+            ("Chart Tool", "chart-tool", "chart_tool", "chartTool"),
+            ("Simple", "simple", "simple", "simple"),
+            ("API v2 Client", "api-v2-client", "api_v2_client", "apiV2Client"),
+            (
+                "Dashboard Helper",
+                "dashboard-helper",
+                "dashboard_helper",
+                "dashboardHelper",
+            ),
+        ]
     ],
 )
-def test_generate_extension_names_complete_flow(
-    display_name, expected_kebab, expected_snake, expected_camel
-):
+def test_generate_extension_names_complete_flow(display_name, technical_name, expected):
     """Test complete name generation flow with publisher concept."""
-    publisher = "test-org"
-    names = generate_extension_names(display_name, publisher, expected_kebab)
-
-    # Test all transformations with publisher concept
-    assert names["display_name"] == display_name
-    assert names["publisher"] == publisher
-    assert names["name"] == expected_kebab  # Technical name
-    assert names["id"] == f"{publisher}.{expected_kebab}"  # Composite ID
-    assert names["npm_name"] == f"@{publisher}/{expected_kebab}"  # NPM scoped
-    assert (
-        names["mf_name"] == f"testOrg_{expected_camel}"
-    )  # Module Federation with publisher prefix
-    assert (
-        names["backend_package"] == f"{publisher.replace('-', '_')}-{expected_snake}"
-    )  # Collision-safe
-    assert names["backend_path"] == f"{publisher.replace('-', '_')}.{expected_snake}"
-    assert (
-        names["backend_entry"]
-        == f"{publisher.replace('-', '_')}.{expected_snake}.entrypoint"
-    )
+    names = generate_extension_names(display_name, TEST_PUBLISHER, technical_name)
+
+    # Comparing the whole mapping also catches unexpected extra keys
+    assert names == expected
 
 
 @pytest.mark.parametrize(
@@ -395,13 +402,52 @@ def test_generate_extension_names_complete_flow(
 def test_generate_extension_names_invalid(invalid_display):
     """Test invalid name generation scenarios."""
     with pytest.raises(ExtensionNameError):
-        generate_extension_names(invalid_display, "test-org")
+        generate_extension_names(invalid_display, TEST_PUBLISHER)
+
+
+@pytest.mark.parametrize(
+    ("publisher", "technical_name"),
+    [
+        ("class-org", None),  # Publisher would create 'class_org'
+        (TEST_PUBLISHER, "import-tool"),  # Manual name would create 'import_tool'
+        (TEST_PUBLISHER, "npm"),  # Reserved npm package name
+    ],
+)
+def test_generate_extension_names_reserved_parts(publisher, technical_name):
+    """Test reserved keywords are rejected in publisher and manual names."""
+    with pytest.raises(ExtensionNameError):
+        generate_extension_names("My Extension", publisher, technical_name)
+
+
+def test_generate_extension_names_many():
+    """Test batch generation matches per-name generation and keeps input order."""
+    display_names = ["Hello World", "Chart Tool", "API v2 Client"]
+
+    names = generate_extension_names_many(display_names, TEST_PUBLISHER)
+
+    assert names == [
+        generate_extension_names(display_name, TEST_PUBLISHER)
+        for display_name in display_names
+    ]
+
+
+@pytest.mark.parametrize(
+    ("display_names", "publisher"),
+    [
+        (["Hello World"], "class-org"),  # Publisher would create 'class_org'
+        (["Hello World", "Import Tool"], TEST_PUBLISHER),  # 'import_tool'
+    ],
+)
+def test_generate_extension_names_many_invalid(display_names, publisher):
+    """Test batch generation rejects an invalid publisher or display name."""
+    with pytest.raises(ExtensionNameError):
+        generate_extension_names_many(display_names, publisher)
 
 
 def test_generate_extension_names_unicode():
     """Test handling of unicode characters."""
     # Use a simpler approach - the display name validation now requires starting with letter
-    names = generate_extension_names("Cafe Extension", "test-org", "cafe-extension")
+    names = generate_extension_names("Cafe Extension", TEST_PUBLISHER, "cafe-extension")
     assert names["id"] == "test-org.cafe-extension"
     assert names["display_name"] == "Cafe Extension"  # Original preserved
 
@@ -409,7 +455,7 @@ def test_generate_extension_names_unicode():
 def test_generate_extension_names_special_chars():
     """Test name generation with special characters."""
     # Use manual technical name since display validation is stricter
-    names = generate_extension_names("My Extension", "test-org", "my-extension")
+    names = generate_extension_names("My Extension", TEST_PUBLISHER, "my-extension")
 
     assert names["display_name"] == "My Extension"
     assert names["id"] == "test-org.my-extension"
@@ -418,7 +464,7 @@ def test_generate_extension_names_special_chars():
 
 def test_generate_extension_names_case_preservation():
     """Test that display name case is preserved."""
-    names = generate_extension_names("CamelCase Extension", "test-org")
+    names = generate_extension_names("CamelCase Extension", TEST_PUBLISHER)
     assert names["display_name"] == "CamelCase Extension"
     assert names["id"] == "test-org.camelcase-extension"
 
@@ -438,19 +484,19 @@ def test_generate_extension_names_case_preservation():
 def test_empty_or_invalid_inputs(edge_case):
     """Test inputs that become empty or invalid after processing."""
     with pytest.raises(ExtensionNameError):
-        generate_extension_names(edge_case, "test-org")
+        generate_extension_names(edge_case, TEST_PUBLISHER)
 
 
 def test_minimal_valid_input():
     """Test minimal valid input."""
-    names = generate_extension_names("A Extension", "test-org")
+    names = generate_extension_names("A Extension", TEST_PUBLISHER)
     assert names["id"] == "test-org.a-extension"
     assert names["backend_package"] == "test_org-a_extension"
 
 
 def test_numbers_handling():
     """Test handling of numbers in names."""
-    names = generate_extension_names("Tool 123 v2", "test-org")
+    names = generate_extension_names("Tool 123 v2", TEST_PUBLISHER)
     assert names["id"] == "test-org.tool-123-v2"
     assert names["backend_package"] == "test_org-tool_123_v2"
 
@@ -480,7 +526,7 @@ def test_manual_technical_name_override():
 def test_generate_names_uses_suggested_technical_names():
     """Test that generate_extension_names can auto-suggest technical names."""
     display_name = "Hello World"
-    publisher = "test-org"
+    publisher = TEST_PUBLISHER
 
     # Generated names should use suggested technical name generation
     names = generate_extension_names(display_name, publisher)
@@ -491,7 +537,7 @@ def test_generate_names_uses_suggested_technical_names():
 
     # Verify other names were generated from the technical name and publisher
     assert names["mf_name"] == get_module_federation_name(
-        "test-org", "hello-world"
+        publisher, "hello-world"
     )  # "testOrg_helloWorld"
     assert names["backend_package"] == "test_org-hello_world"
 
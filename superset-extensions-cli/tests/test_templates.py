@@ -18,13 +18,17 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
+from typing import Any
 
 import pytest
 from jinja2 import Environment, FileSystemLoader
+from pydantic_core import from_json
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def templates_dir():
     """Get the templates directory path."""
     return (
@@ -32,43 +36,72 @@ def templates_dir():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def jinja_env(templates_dir):
-    """Create a Jinja2 environment for testing templates."""
-    return Environment(loader=FileSystemLoader(templates_dir))
+    """Create a Jinja2 environment shared by all template tests."""
+    # Templates don't change during a test run, so compile each one once and skip
+    # the per-render up-to-date check
+    env = Environment(
+        loader=FileSystemLoader(templates_dir), auto_reload=False, cache_size=-1
+    )
+    for template_name in (
+        "extension.json.j2",
+        "frontend/package.json.j2",
+        "backend/pyproject.toml.j2",
+    ):
+        env.get_template(template_name)
+    return env
+
+
+@pytest.fixture(scope="session")
+def render_json(jinja_env):
+    """
+    Render a JSON template and parse the output.
+
+    Each (template, context) pair is rendered and parsed once per session; the
+    parsed result is shared, so tests must not modify it.
+    """
+    cache: dict[tuple[str, tuple[tuple[str, Any], ...]], dict[str, Any]] = {}
+
+    def render(template_name: str, context: Mapping[str, Any]) -> dict[str, Any]:
+        key = (template_name, tuple(sorted(context.items())))
+        if key not in cache:
+            rendered = jinja_env.get_template(template_name).render(context)
+            cache[key] = from_json(rendered)
+        return cache[key]
+
+    return render
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def template_context():
-    """Default template context for testing."""
-    return {
-        "publisher": "test-org",
-        "name": "test-extension",
-        "display_name": "Test Extension",
-        "id": "test-org.test-extension",
-        "npm_name": "@test-org/test-extension",
-        "mf_name": "testOrg_testExtension",
-        "backend_package": "test_org-test_extension",
-        "backend_path": "test_org.test_extension",
-        "backend_entry": "test_org.test_extension.entrypoint",
-        "version": "0.1.0",
-        "license": "Apache-2.0",
-        "include_frontend": True,
-        "include_backend": True,
-    }
+    """Default template context for testing, read-only so tests can't leak changes."""
+    return MappingProxyType(
+        {
+            "publisher": "test-org",
+            "name": "test-extension",
+            "display_name": "Test Extension",
+            "id": "test-org.test-extension",
+            "npm_name": "@test-org/test-extension",
+            "mf_name": "testOrg_testExtension",
+            "backend_package": "test_org-test_extension",
+            "backend_path": "test_org.test_extension",
+            "backend_entry": "test_org.test_extension.entrypoint",
+            "version": "0.1.0",
+            "license": "Apache-2.0",
+            "include_frontend": True,
+            "include_backend": True,
+        }
+    )
 
 
 # Extension JSON Template Tests
 @pytest.mark.unit
 def test_extension_json_template_renders_with_both_frontend_and_backend(
-    jinja_env, template_context
+    render_json, template_context
 ):
     """Test extension.json template renders correctly with both frontend and backend."""
-    template = jinja_env.get_template("extension.json.j2")
-    rendered = template.render(template_context)
-
-    # Parse the rendered JSON to ensure it's valid
-    parsed = json.loads(rendered)
+    parsed = render_json("extension.json.j2", template_context)
 
     # Verify basic fields
     assert parsed["publisher"] == "test-org"
@@ -95,16 +128,16 @@ def test_extension_json_template_renders_with_both_frontend_and_backend(
     ],
 )
 def test_extension_json_template_renders_with_different_configurations(
-    jinja_env, template_context, include_frontend, include_backend, expected_sections
+    render_json, template_context, include_frontend, include_backend, expected_sections
 ):
     """Test extension.json template renders correctly with different configurations."""
-    template_context["include_frontend"] = include_frontend
-    template_context["include_backend"] = include_backend
-
-    template = jinja_env.get_template("extension.json.j2")
-    rendered = template.render(template_context)
+    context = {
+        **template_context,
+        "include_frontend": include_frontend,
+        "include_backend": include_backend,
+    }
 
-    parsed = json.loads(rendered)
+    parsed = render_json("extension.json.j2", context)
 
     # Check for expected sections
     for section in expected_sections:
@@ -119,12 +152,11 @@ def test_extension_json_template_renders_with_different_configurations(
 
 # Frontend Package JSON Template Tests
 @pytest.mark.unit
-def test_frontend_package_json_template_renders_correctly(jinja_env, template_context):
+def test_frontend_package_json_template_renders_correctly(
+    render_json, template_context
+):
     """Test frontend/package.json template renders correctly."""
-    template = jinja_env.get_template("frontend/package.json.j2")
-    rendered = template.render(template_context)
-
-    parsed = json.loads(rendered)
+    parsed = render_json("frontend/package.json.j2", template_context)
 
     # Verify basic package info
     assert parsed["name"] == "@test-org/test-extension"
@@ -178,7 +210,7 @@ def test_backend_pyproject_toml_template_renders_correctly(jinja_env, template_c
     ],
 )
 def test_template_rendering_with_different_ids(
-    jinja_env, publisher, technical_name, display_name
+    jinja_env, render_json, publisher, technical_name, display_name
 ):
     """Test templates render correctly with various publisher/name combinations."""
     from superset_extensions_cli.utils import (
@@ -206,9 +238,7 @@ def test_template_rendering_with_different_ids(
     }
 
     # Test extension.json template
-    template = jinja_env.get_template("extension.json.j2")
-    rendered = template.render(context)
-    parsed = json.loads(rendered)
+    parsed = render_json("extension.json.j2", context)
 
     assert parsed["publisher"] == publisher
     assert parsed["name"] == technical_name
@@ -216,9 +246,7 @@ def test_template_rendering_with_different_ids(
     assert "backend" not in parsed
 
     # Test package.json template
-    template = jinja_env.get_template("frontend/package.json.j2")
-    rendered = template.render(context)
-    parsed = json.loads(rendered)
+    parsed = render_json("frontend/package.json.j2", context)
 
     assert parsed["name"] == f"@{publisher}/{technical_name}"
 
@@ -231,7 +259,7 @@ def test_template_rendering_with_different_ids(
 
 @pytest.mark.unit
 @pytest.mark.parametrize("version", ["0.1.0", "1.0.0", "2.1.3-alpha", "10.20.30"])
-def test_template_rendering_with_different_versions(jinja_env, version):
+def test_template_rendering_with_different_versions(render_json, version):
     """Test templates render correctly with various version formats."""
     context = {
         "publisher": "test-pub",
@@ -246,9 +274,7 @@ def test_template_rendering_with_different_versions(jinja_env, version):
         "include_backend": False,
     }
 
-    template = jinja_env.get_template("extension.json.j2")
-    rendered = template.render(context)
-    parsed = json.loads(rendered)
+    parsed = render_json("extension.json.j2", context)
 
     assert parsed["version"] == version
 
@@ -264,7 +290,7 @@ def test_template_rendering_with_different_versions(jinja_env, version):
         "Custom License",
     ],
 )
-def test_template_rendering_with_different_licenses(jinja_env, license_type):
+def test_template_rendering_with_different_licenses(render_json, license_type):
     """Test templates render correctly with various license types."""
     context = {
         "publisher": "test-pub",
@@ -283,16 +309,12 @@ def test_template_rendering_with_different_licenses(jinja_env, license_type):
     }
 
     # Test extension.json template
-    template = jinja_env.get_template("extension.json.j2")
-    rendered = template.render(context)
-    parsed = json.loads(rendered)
+    parsed = render_json("extension.json.j2", context)
 
     assert parsed["license"] == license_type
 
     # Test package.json template
-    template = jinja_env.get_template("frontend/package.json.j2")
-    rendered = template.render(context)
-    parsed = json.loads(rendered)
+    parsed = render_json("frontend/package.json.j2", context)
 
     assert parsed["license"] == license_type
 
@@ -302,15 +324,12 @@ def test_template_rendering_with_different_licenses(jinja_env, license_type):
 @pytest.mark.parametrize(
     "template_name", ["extension.json.j2", "frontend/package.json.j2"]
 )
-def test_templates_produce_valid_json(jinja_env, template_context, template_name):
+def test_templates_produce_valid_json(render_json, template_context, template_name):
     """Test that all JSON templates produce valid JSON output."""
-    template = jinja_env.get_template(template_name)
-    rendered = template.render(template_context)
-
     # This will raise an exception if the JSON is invalid
     try:
-        json.loads(rendered)
-    except json.JSONDecodeError as e:
+        render_json(template_name, template_context)
+    except ValueError as e:
         pytest.fail(f"Template {template_name} produced invalid JSON: {e}")
 
 
@@ -336,7 +355,7 @@ def test_template_whitespace_handling(jinja_env, template_context):
 
 
 @pytest.mark.unit
-def test_template_context_edge_cases(jinja_env):
+def test_template_context_edge_cases(render_json):
     """Test template rendering with edge case contexts."""
     # Test with minimal context
     minimal_context = {
@@ -355,9 +374,7 @@ def test_template_context_edge_cases(jinja_env):
         "include_backend": False,
     }
 
-    template = jinja_env.get_template("extension.json.j2")
-    rendered = template.render(minimal_context)
-    parsed = json.loads(rendered)
+    parsed = render_json("extension.json.j2", minimal_context)
 
     # Should still be valid JSON with basic fields
     assert parsed["publisher"] == "min"
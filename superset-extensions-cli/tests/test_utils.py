@@ -203,6 +203,30 @@ def test_read_toml_with_empty_file(isolated_filesystem):
     assert result == {}
 
 
+@pytest.mark.unit
+def test_read_toml_returns_independent_copies(isolated_filesystem):
+    """Test read_toml results can be modified without affecting later reads."""
+    toml_file = isolated_filesystem / "pyproject.toml"
+    toml_file.write_text('[project]\nversion = "1.0.0"')
+
+    first = read_toml(toml_file)
+    first["project"]["version"] = "2.0.0"
+
+    assert read_toml(toml_file) == {"project": {"version": "1.0.0"}}
+
+
+@pytest.mark.unit
+def test_read_toml_picks_up_file_changes(isolated_filesystem):
+    """Test read_toml re-parses the file once it changes on disk."""
+    toml_file = isolated_filesystem / "pyproject.toml"
+    toml_file.write_text('[project]\nversion = "1.0.0"')
+    assert read_toml(toml_file) == {"project": {"version": "1.0.0"}}
+
+    toml_file.write_text('[project]\nversion = "1.0.0-rc1"')
+
+    assert read_toml(toml_file) == {"project": {"version": "1.0.0-rc1"}}
+
+
 @pytest.mark.unit
 @pytest.mark.parametrize(
     "invalid_content",
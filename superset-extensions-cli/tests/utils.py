@@ -18,6 +18,9 @@
 from __future__ import annotations
 
 import json
+import os
+from collections.abc import Sequence
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -50,6 +53,18 @@ def assert_directory_exists(path: Path, description: str = "") -> None:
     assert path.is_dir(), f"Expected {path}{desc_msg} to be a directory, but it's not"
 
 
+def _collect_tree(base_path: Path) -> tuple[set[str], set[str]]:
+    """Collect all directories and files under `base_path` as relative POSIX paths."""
+    dirs: set[str] = set()
+    files: set[str] = set()
+    for dirpath, dirnames, filenames in os.walk(base_path):
+        relative = Path(dirpath).relative_to(base_path).as_posix()
+        prefix = "" if relative == "." else f"{relative}/"
+        dirs.update(prefix + name for name in dirnames)
+        files.update(prefix + name for name in filenames)
+    return dirs, files
+
+
 def assert_file_structure(base_path: Path, expected_files: list[str]) -> None:
     """
     Assert that all expected files exist under the base path.
@@ -58,9 +73,16 @@ def assert_file_structure(base_path: Path, expected_files: list[str]) -> None:
         base_path: Base directory path
         expected_files: List of relative file paths that should exist
     """
-    for file_path in expected_files:
-        full_path = base_path / file_path
-        assert_file_exists(full_path, "part of expected structure")
+    _, actual_files = _collect_tree(base_path)
+    missing = [
+        file_path
+        for file_path in expected_files
+        if Path(file_path).as_posix() not in actual_files
+    ]
+    assert not missing, (
+        f"Expected files {missing} (part of expected structure) to exist under "
+        f"{base_path}, but they don't"
+    )
 
 
 def assert_directory_structure(base_path: Path, expected_dirs: list[str]) -> None:
@@ -71,9 +93,16 @@ def assert_directory_structure(base_path: Path, expected_dirs: list[str]) -> Non
         base_path: Base directory path
         expected_dirs: List of relative directory paths that should exist
     """
-    for dir_path in expected_dirs:
-        full_path = base_path / dir_path
-        assert_directory_exists(full_path, "part of expected structure")
+    actual_dirs, _ = _collect_tree(base_path)
+    missing = [
+        dir_path
+        for dir_path in expected_dirs
+        if Path(dir_path).as_posix() not in actual_dirs
+    ]
+    assert not missing, (
+        f"Expected directories {missing} (part of expected structure) to exist "
+        f"under {base_path}, but they don't"
+    )
 
 
 def get_directory_tree(path: Path, ignore: set[str] | None = None) -> set[str]:
@@ -123,24 +152,42 @@ def load_json_file(path: Path) -> dict[str, Any]:
         raise AssertionError(f"File {path} contains invalid JSON: {e}")
 
 
-def assert_json_content(path: Path, expected_values: dict[str, Any]) -> None:
+def assert_json_content(
+    source: Path | dict[str, Any], expected_values: dict[str, Any]
+) -> None:
     """
-    Assert that a JSON file contains expected key-value pairs.
+    Assert that JSON content contains expected key-value pairs.
 
     Args:
-        path: Path to the JSON file
+        source: Path to the JSON file, or its already parsed content
         expected_values: Dictionary of expected key-value pairs
     """
-    content = load_json_file(path)
+    content = load_json_file(source) if isinstance(source, Path) else source
 
     for key, expected_value in expected_values.items():
-        assert key in content, f"Expected key '{key}' not found in {path}"
+        assert key in content, f"Expected key '{key}' not found in {source}"
         actual_value = content[key]
         assert actual_value == expected_value, (
-            f"Expected {key}='{expected_value}' but got '{actual_value}' in {path}"
+            f"Expected {key}='{expected_value}' but got '{actual_value}' in {source}"
         )
 
 
+def assert_json_file(path: Path, expected_values: dict[str, Any]) -> dict[str, Any]:
+    """
+    Assert that a JSON file contains expected key-value pairs.
+
+    Args:
+        path: Path to the JSON file
+        expected_values: Dictionary of expected key-value pairs
+
+    Returns:
+        Parsed JSON content, for further assertions without re-reading the file
+    """
+    content = load_json_file(path)
+    assert_json_content(content, expected_values)
+    return content
+
+
 def assert_file_contains(path: Path, text: str) -> None:
     """
     Assert that a file contains specific text.
@@ -171,6 +218,42 @@ def assert_file_content_matches(path: Path, expected_content: str) -> None:
     )
 
 
+def assert_output_contains_all(output: str, patterns: Sequence[str]) -> None:
+    """
+    Assert that command output contains every expected text.
+
+    Args:
+        output: Command output to search
+        patterns: Literal texts that should all be present
+    """
+    missing = [p for p in patterns if p not in output]
+    assert not missing, (
+        "Expected text not found in output:\n"
+        + "\n".join(f"  {p}" for p in missing)
+        + f"\nOutput:\n{output}"
+    )
+
+
+@lru_cache(maxsize=4)
+def _expected_structure(
+    include_frontend: bool, include_backend: bool
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    # Paths are relative to the extension directory, so they only depend on which
+    # parts are included and can be computed once per combination
+    expected_files = ["extension.json", ".gitignore"]
+    expected_dirs: list[str] = []
+
+    if include_frontend:
+        expected_dirs.append("frontend")
+        expected_files.append("frontend/package.json")
+
+    if include_backend:
+        expected_dirs.append("backend")
+        expected_files.append("backend/pyproject.toml")
+
+    return tuple(expected_files), tuple(expected_dirs)
+
+
 def create_test_extension_structure(
     base_path: Path,
     id_: str,
@@ -190,22 +273,14 @@ def create_test_extension_structure(
     Returns:
         Dictionary with expected paths and metadata
     """
-    extension_path = base_path / id_
-    expected_files = ["extension.json", ".gitignore"]
-    expected_dirs: list[str] = []
-
-    if include_frontend:
-        expected_dirs.append("frontend")
-        expected_files.append("frontend/package.json")
-
-    if include_backend:
-        expected_dirs.append("backend")
-        expected_files.append("backend/pyproject.toml")
+    expected_files, expected_dirs = _expected_structure(
+        include_frontend, include_backend
+    )
 
     expected = {
-        "extension_path": extension_path,
-        "expected_files": expected_files,
-        "expected_dirs": expected_dirs,
+        "extension_path": base_path / id_,
+        "expected_files": list(expected_files),
+        "expected_dirs": list(expected_dirs),
     }
 
     return expected
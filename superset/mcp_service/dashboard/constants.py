@@ -20,19 +20,42 @@ Shared constants for MCP dashboard tools.
 
 Values match frontend defaults from
 ``superset-frontend/src/dashboard/util/constants.ts``.
+
+Component IDs only need to be unique within a dashboard layout, like the
+frontend's ``nanoid()`` IDs, so they are drawn from a non-cryptographic PRNG:
+collision-resistant over a 2**32 space, but not unpredictable. The generator is
+reseeded in forked children so worker processes don't emit the same sequence.
 """
 
-import uuid
+import os
+import random
 
 GRID_DEFAULT_CHART_WIDTH = 4
 GRID_COLUMN_COUNT = 12
 
+_id_random = random.Random()  # noqa: S311
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_id_random.seed)
+
 
 def generate_id(prefix: str) -> str:
     """
     Generate a component ID matching the frontend's nanoid-style pattern.
 
-    Uses a UUID hex prefix to produce IDs like ``ROW-a1b2c3d4`` which are
+    Uses 32 random bits in hex to produce IDs like ``ROW-a1b2c3d4`` which are
     compatible with the frontend's ``nanoid()``-based ID generation.
     """
-    return f"{prefix}-{uuid.uuid4().hex[:8]}"
+    return f"{prefix}-{_id_random.getrandbits(32):08x}"
+
+
+def generate_ids(prefix: str, count: int) -> list[str]:
+    """
+    Generate ``count`` component IDs in the same format as ``generate_id``.
+
+    Draws the random bits for all IDs at once, which is cheaper than calling
+    ``generate_id`` in a loop when building a whole layout.
+    """
+    if count <= 0:
+        return []
+    random_hex = f"{_id_random.getrandbits(32 * count):0{8 * count}x}"
+    return [f"{prefix}-{random_hex[i : i + 8]}" for i in range(0, 8 * count, 8)]
@@ -32,7 +32,7 @@ from superset_core.mcp.decorators import tool, ToolAnnotations
 
 from superset.extensions import db, event_logger
 from superset.mcp_service.dashboard.constants import (
-    generate_id,
+    generate_ids,
     GRID_COLUMN_COUNT,
     GRID_DEFAULT_CHART_WIDTH,
 )
@@ -71,22 +71,18 @@ def _create_dashboard_layout(chart_objects: List[Any]) -> Dict[str, Any]:
     chart_height = 50  # Good height for most chart types
 
     # Create rows with charts wrapped in columns
-    row_ids = []
-    for i in range(0, len(chart_objects), charts_per_row):
-        row_id = generate_id("ROW")
-        row_ids.append(row_id)
-
+    row_starts = range(0, len(chart_objects), charts_per_row)
+    row_ids = generate_ids("ROW", len(row_starts))
+    for row_id, i in zip(row_ids, row_starts, strict=True):
         # Get charts for this row (up to 2 charts like real dashboards)
         row_charts = chart_objects[i : i + charts_per_row]
-        column_keys = []
+        column_keys = generate_ids("COLUMN", len(row_charts))
 
         # Calculate column width: divide grid evenly among charts in this row
         col_width = GRID_COLUMN_COUNT // len(row_charts)
 
-        for chart in row_charts:
+        for chart, column_key in zip(row_charts, column_keys, strict=True):
             chart_key = f"CHART-{chart.id}"
-            column_key = generate_id("COLUMN")
-            column_keys.append(column_key)
 
             # Create chart component with standard dimensions
             layout[chart_key] = {
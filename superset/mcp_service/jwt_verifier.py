@@ -27,13 +27,14 @@ HTTP responses always return generic errors per RFC 6750 Section 3.1.
 
 import asyncio
 import base64
+import copy
 import html as html_module
 import logging
 import math
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from contextvars import ContextVar
-from typing import Any, cast
+from typing import Any
 
 import httpx
 from authlib.jose import JsonWebToken
@@ -445,16 +446,11 @@ class DetailedBearerAuthBackend(BearerAuthBackend):
             return result
 
         # Check if there's a Bearer token present - if so, there was a
-        # validation failure we can report with a specific reason
-        auth_header = next(
-            (
-                conn.headers.get(key)
-                for key in conn.headers
-                if key.lower() == "authorization"
-            ),
-            None,
-        )
-        if auth_header and auth_header.lower().startswith("bearer "):
+        # validation failure we can report with a specific reason.
+        # Starlette's Headers lookup is already case-insensitive.
+        auth_header = conn.headers.get("authorization")
+        # Lowercase only the scheme, not the (possibly multi-kilobyte) token
+        if auth_header and auth_header[:7].lower() == "bearer ":
             reason = _jwt_failure_reason.get()
             if reason:
                 _jwt_failure_reason.set(None)
@@ -478,16 +474,44 @@ class DetailedJWTVerifier(MCPJWTVerifier):
     Controlled by MCP_JWT_DEBUG_ERRORS config flag.
     """
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Frozenset forms of the issuer/audience/required-scope settings, keyed
+        # by attribute name and cached against a copy of the value they were
+        # built from
+        self._config_sets: dict[str, tuple[Any, frozenset[str] | None]] = {}
+
+    def _config_set(self, attr: str) -> frozenset[str] | None:
+        """
+        Return a str-or-list verifier setting as a frozenset, or None if unset.
+
+        The set is reused for as long as the setting compares equal to the copy
+        it was built from, so validating a token doesn't rebuild it while later
+        config changes, whether reassigned or edited in place, still take
+        effect.
+        """
+        value = getattr(self, attr)
+        cached = self._config_sets.get(attr)
+        if cached is not None and cached[0] == value:
+            return cached[1]
+        if not value:
+            normalized = None
+        elif isinstance(value, str):
+            normalized = frozenset((value,))
+        else:
+            normalized = frozenset(value)
+        # Keep a copy so that in-place edits to a list setting are noticed
+        self._config_sets[attr] = (copy.copy(value), normalized)
+        return normalized
+
     async def load_access_token(self, token: str) -> AccessToken | None:  # noqa: C901
         """
         Validate a JWT bearer token with detailed error reporting.
 
         Each validation step stores a specific failure reason in the
-        _jwt_failure_reason ContextVar before returning None.
+        _jwt_failure_reason ContextVar before returning None; a successful
+        validation clears it.
         """
-        # Reset any previous failure reason
-        _jwt_failure_reason.set(None)
-
         try:
             # Step 1: Decode header and check algorithm
             try:
@@ -589,23 +613,14 @@ class DetailedJWTVerifier(MCPJWTVerifier):
                 _jwt_failure_reason.set(reason)
                 return None
 
-            # Extract client ID for logging
-            client_id = (
-                claims.get("client_id")
-                or claims.get("azp")
-                or claims.get("sub")
-                or "unknown"
-            )
-
             # Step 4: Check expiration. An ``exp`` claim is required — tokens
             # without one would never expire and are rejected.
             exp = claims.get("exp")
             if exp is None:
                 reason = "Token missing expiration"
                 _jwt_failure_reason.set(reason)
-                logger.debug(
-                    "Token missing required exp claim for client '%s'",
-                    _sanitize_for_log(client_id),
+                self._log_client_debug(
+                    "Token missing required exp claim for client '%s'", claims
                 )
                 return None
             # ``exp`` must be a finite real number. A non-numeric value would
@@ -621,17 +636,16 @@ class DetailedJWTVerifier(MCPJWTVerifier):
             ):
                 reason = "Token has invalid expiration"
                 _jwt_failure_reason.set(reason)
-                logger.debug(
-                    "Token exp claim is not a finite number for client '%s'",
-                    _sanitize_for_log(client_id),
+                self._log_client_debug(
+                    "Token exp claim is not a finite number for client '%s'", claims
                 )
                 return None
-            if exp < time.time():
+            # Read the clock once for both temporal claims
+            now = time.time()
+            if exp < now:
                 reason = "Token expired"
                 _jwt_failure_reason.set(reason)
-                logger.debug(
-                    "Token expired for client '%s'", _sanitize_for_log(client_id)
-                )
+                self._log_client_debug("Token expired for client '%s'", claims)
                 return None
 
             # Step 4b: Check not-before (RFC 7519 Section 4.1.5). ``decode``
@@ -640,24 +654,18 @@ class DetailedJWTVerifier(MCPJWTVerifier):
             # whose ``nbf`` is in the future must be rejected explicitly, just
             # like ``exp`` above.
             nbf = claims.get("nbf")
-            if nbf is not None and nbf > time.time():
+            if nbf is not None and nbf > now:
                 reason = "Token not yet valid"
                 _jwt_failure_reason.set(reason)
-                logger.debug(
-                    "Token not yet valid for client '%s': nbf is in the future",
-                    _sanitize_for_log(client_id),
+                self._log_client_debug(
+                    "Token not yet valid for client '%s': nbf is in the future", claims
                 )
                 return None
 
             # Step 5: Validate issuer
-            if self.issuer:
+            if (issuers := self._config_set("issuer")) is not None:
                 iss = claims.get("iss")
-                if isinstance(self.issuer, list):
-                    issuer_valid = iss in self.issuer
-                else:
-                    issuer_valid = iss == self.issuer
-
-                if not issuer_valid:
+                if not (isinstance(iss, str) and iss in issuers):
                     reason = "Issuer mismatch"
                     _jwt_failure_reason.set(reason)
                     logger.debug(
@@ -668,23 +676,14 @@ class DetailedJWTVerifier(MCPJWTVerifier):
                     return None
 
             # Step 6: Validate audience
-            if self.audience:
+            if (audiences := self._config_set("audience")) is not None:
                 aud = claims.get("aud")
-                if isinstance(self.audience, list):
-                    if isinstance(aud, list):
-                        audience_valid = any(
-                            expected in aud
-                            for expected in cast(list[str], self.audience)
-                        )
-                    else:
-                        audience_valid = aud in cast(list[str], self.audience)
-                else:
-                    if isinstance(aud, list):
-                        audience_valid = self.audience in aud
-                    else:
-                        audience_valid = aud == self.audience
-
-                if not audience_valid:
+                token_audiences = aud if isinstance(aud, list) else (aud,)
+                # Only string entries can match; skipping the rest also keeps
+                # unhashable claim values away from the set lookup.
+                if audiences.isdisjoint(
+                    value for value in token_audiences if isinstance(value, str)
+                ):
                     reason = "Audience mismatch"
                     _jwt_failure_reason.set(reason)
                     logger.debug(
@@ -696,22 +695,33 @@ class DetailedJWTVerifier(MCPJWTVerifier):
 
             # Step 7: Check required scopes
             scopes = self._extract_scopes(claims)
-            if self.required_scopes:
-                token_scopes = set(scopes)
-                required = set(self.required_scopes)
-                if not required.issubset(token_scopes):
-                    missing = required - token_scopes
+            if (required := self._config_set("required_scopes")) is not None:
+                # A linear scan beats building a set for the usual handful of
+                # token scopes
+                if len(scopes) <= 4:
+                    has_required = all(scope in scopes for scope in required)
+                else:
+                    has_required = required.issubset(scopes)
+                if not has_required:
                     reason = "Missing required scopes"
                     _jwt_failure_reason.set(reason)
-                    logger.debug(
-                        "Missing required scopes: %s. Token has: %s",
-                        missing,
-                        token_scopes,
-                    )
+                    if logger.isEnabledFor(logging.DEBUG):
+                        token_scopes = set(scopes)
+                        logger.debug(
+                            "Missing required scopes: %s. Token has: %s",
+                            required - token_scopes,
+                            token_scopes,
+                        )
                     return None
 
-            # All validations passed. Log the successful authentication with
-            # safe metadata only — never the token contents or any secret.
+            # All validations passed. Every failure branch above overwrites the
+            # reason, so a stale one from an earlier request only needs clearing
+            # here.
+            _jwt_failure_reason.set(None)
+
+            # Log the successful authentication with safe metadata only — never
+            # the token contents or any secret.
+            client_id = self._client_id_from_claims(claims)
             # Coerce scope entries to strings before sorting so a malformed
             # (non-orderable) scope claim can never turn this audit log into a
             # TypeError that would mask a successful auth as a failure.
@@ -727,7 +737,8 @@ class DetailedJWTVerifier(MCPJWTVerifier):
                 client_id=str(client_id),
                 scopes=scopes,
                 expires_at=int(exp),
-                claims=dict(claims),
+                # AccessToken validates claims into a new plain dict itself
+                claims=claims,
             )
 
         except (
@@ -760,15 +771,38 @@ class DetailedJWTVerifier(MCPJWTVerifier):
             Middleware(AuthContextMiddleware),
         ]
 
+    @staticmethod
+    def _client_id_from_claims(claims: Mapping[str, Any]) -> Any:
+        """Identify the token's client for logging and the AccessToken."""
+        return (
+            claims.get("client_id")
+            or claims.get("azp")
+            or claims.get("sub")
+            or "unknown"
+        )
+
+    @classmethod
+    def _log_client_debug(cls, message: str, claims: Mapping[str, Any]) -> None:
+        """
+        Log a DEBUG message naming the token's client.
+
+        The client ID is only looked up and sanitized when DEBUG logging is
+        enabled, so rejected tokens don't pay for it in production.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(message, _sanitize_for_log(cls._client_id_from_claims(claims)))
+
     @staticmethod
     def _decode_token_header(token: str) -> dict[str, Any]:
         """Decode the JWT header without verifying the signature."""
-        parts = token.split(".")
-        if len(parts) != 3:
+        # Count the separators instead of splitting, so that only the header
+        # segment is copied out of what can be a multi-kilobyte token
+        part_count = token.count(".") + 1
+        if part_count != 3:
             raise ValueError(
-                f"Token must have 3 parts (header.payload.signature), got {len(parts)}"
+                f"Token must have 3 parts (header.payload.signature), got {part_count}"
             )
-        header_b64 = parts[0]
+        header_b64 = token[: token.index(".")]
         # Add padding only if needed
         header_b64 += "=" * (-len(header_b64) % 4)
         header_bytes = base64.urlsafe_b64decode(header_b64)
@@ -657,21 +657,22 @@ def default_user_resolver(app: Any, access_token: Any) -> str | None:
             return username
 
     # Legacy attribute access for backward compatibility
-    if hasattr(access_token, "subject") and access_token.subject:
-        return access_token.subject
-    if hasattr(access_token, "client_id") and access_token.client_id:
-        return access_token.client_id
-    if hasattr(access_token, "payload") and isinstance(access_token.payload, dict):
-        return (
-            access_token.payload.get("sub")
-            or access_token.payload.get("email")
-            or access_token.payload.get("username")
-        )
+    if subject := getattr(access_token, "subject", None):
+        return subject
+    if client_id := getattr(access_token, "client_id", None):
+        return client_id
+    payload = getattr(access_token, "payload", None)
+    if isinstance(payload, dict):
+        return payload.get("sub") or payload.get("email") or payload.get("username")
     return None
 
 
 def generate_secret_key() -> str:
-    """Generate a secure random secret key."""
+    """Generate a secure random secret key.
+
+    Every call returns a fresh key; callers that need a stable key across
+    reloads must persist it themselves.
+    """
     return secrets.token_urlsafe(42)
 
 
@@ -18,6 +18,7 @@
 
 from __future__ import annotations
 
+from typing import Any
 from unittest.mock import Mock, patch
 
 import pytest
@@ -84,150 +85,130 @@ def _setup_mocks(mocker: MockerFixture, model: Mock) -> None:
     )
 
 
-def _get_validation_messages(
+def _get_validation_message(
     exc_info: pytest.ExceptionInfo[ReportScheduleInvalidError],
-) -> dict[str, str]:
-    """Extract field→first message string from ReportScheduleInvalidError."""
+    field: str,
+) -> str:
+    """Assert ``field`` failed validation and return its first message string."""
     raw = exc_info.value.normalized_messages()
-    result = {}
-    for field, msgs in raw.items():
-        if isinstance(msgs, list):
-            result[field] = str(msgs[0])
-        else:
-            result[field] = str(msgs)
-    return result
+    assert field in raw
+    msgs = raw[field]
+    return str(msgs[0] if isinstance(msgs, list) else msgs)
 
 
-# --- Report type: database must NOT be set ---
+# --- Database presence by report type ---
+# Reports must NOT have a database; alerts MUST have one. The effective type and
+# database come from the payload when present, otherwise from the model.
 
 
-def test_report_with_database_in_payload_rejected(mocker: MockerFixture) -> None:
-    model = _make_model(mocker, model_type=ReportScheduleType.REPORT, database_id=None)
-    _setup_mocks(mocker, model)
-
-    cmd = UpdateReportScheduleCommand(model_id=1, data={"database": 5})
-    with pytest.raises(ReportScheduleInvalidError) as exc_info:
-        cmd.validate()
-    messages = _get_validation_messages(exc_info)
-    assert "database" in messages
-    assert "not allowed" in messages["database"].lower()
-
-
-def test_report_with_database_none_in_payload_accepted(mocker: MockerFixture) -> None:
-    model = _make_model(mocker, model_type=ReportScheduleType.REPORT, database_id=None)
-    _setup_mocks(mocker, model)
-
-    cmd = UpdateReportScheduleCommand(model_id=1, data={"database": None})
-    cmd.validate()  # should not raise
-
-
-def test_report_no_database_in_payload_model_has_db_rejected(
-    mocker: MockerFixture,
-) -> None:
-    model = _make_model(mocker, model_type=ReportScheduleType.REPORT, database_id=5)
-    _setup_mocks(mocker, model)
-
-    cmd = UpdateReportScheduleCommand(model_id=1, data={})
-    with pytest.raises(ReportScheduleInvalidError) as exc_info:
-        cmd.validate()
-    messages = _get_validation_messages(exc_info)
-    assert "database" in messages
-    assert "not allowed" in messages["database"].lower()
-
-
-def test_report_no_database_anywhere_accepted(mocker: MockerFixture) -> None:
-    model = _make_model(mocker, model_type=ReportScheduleType.REPORT, database_id=None)
-    _setup_mocks(mocker, model)
-
-    cmd = UpdateReportScheduleCommand(model_id=1, data={})
-    cmd.validate()  # should not raise
-
-
-# --- Alert type: database MUST be set ---
-
-
-def test_alert_with_database_in_payload_accepted(mocker: MockerFixture) -> None:
-    model = _make_model(mocker, model_type=ReportScheduleType.ALERT, database_id=None)
-    _setup_mocks(mocker, model)
-
-    cmd = UpdateReportScheduleCommand(model_id=1, data={"database": 5})
-    cmd.validate()  # should not raise
-
-
-def test_alert_with_database_none_in_payload_rejected(mocker: MockerFixture) -> None:
-    model = _make_model(mocker, model_type=ReportScheduleType.ALERT, database_id=5)
-    _setup_mocks(mocker, model)
-
-    cmd = UpdateReportScheduleCommand(model_id=1, data={"database": None})
-    with pytest.raises(ReportScheduleInvalidError) as exc_info:
-        cmd.validate()
-    messages = _get_validation_messages(exc_info)
-    assert "database" in messages
-    assert "required" in messages["database"].lower()
-
-
-def test_alert_no_database_in_payload_model_has_db_accepted(
+@pytest.mark.parametrize(
+    "model_type,database_id,data,expected_error",
+    [
+        pytest.param(
+            ReportScheduleType.REPORT,
+            None,
+            {"database": 5},
+            "not allowed",
+            id="report_with_database_in_payload_rejected",
+        ),
+        pytest.param(
+            ReportScheduleType.REPORT,
+            None,
+            {"database": None},
+            None,
+            id="report_with_database_none_in_payload_accepted",
+        ),
+        pytest.param(
+            ReportScheduleType.REPORT,
+            5,
+            {},
+            "not allowed",
+            id="report_no_database_in_payload_model_has_db_rejected",
+        ),
+        pytest.param(
+            ReportScheduleType.REPORT,
+            None,
+            {},
+            None,
+            id="report_no_database_anywhere_accepted",
+        ),
+        pytest.param(
+            ReportScheduleType.ALERT,
+            None,
+            {"database": 5},
+            None,
+            id="alert_with_database_in_payload_accepted",
+        ),
+        pytest.param(
+            ReportScheduleType.ALERT,
+            5,
+            {"database": None},
+            "required",
+            id="alert_with_database_none_in_payload_rejected",
+        ),
+        pytest.param(
+            ReportScheduleType.ALERT,
+            5,
+            {},
+            None,
+            id="alert_no_database_in_payload_model_has_db_accepted",
+        ),
+        pytest.param(
+            ReportScheduleType.ALERT,
+            None,
+            {},
+            "required",
+            id="alert_no_database_anywhere_rejected",
+        ),
+        pytest.param(
+            ReportScheduleType.ALERT,
+            5,
+            {"type": ReportScheduleType.REPORT},
+            "not allowed",
+            id="alert_to_report_without_clearing_db_rejected",
+        ),
+        pytest.param(
+            ReportScheduleType.ALERT,
+            5,
+            {"type": ReportScheduleType.REPORT, "database": None},
+            None,
+            id="alert_to_report_with_db_cleared_accepted",
+        ),
+        pytest.param(
+            ReportScheduleType.REPORT,
+            None,
+            {"type": ReportScheduleType.ALERT},
+            "required",
+            id="report_to_alert_without_db_rejected",
+        ),
+        pytest.param(
+            ReportScheduleType.REPORT,
+            None,
+            {"type": ReportScheduleType.ALERT, "database": 5},
+            None,
+            id="report_to_alert_with_db_accepted",
+        ),
+    ],
+)
+def test_validate_database_for_report_type(
     mocker: MockerFixture,
+    model_type: ReportScheduleType,
+    database_id: int | None,
+    data: dict[str, Any],
+    expected_error: str | None,
 ) -> None:
-    model = _make_model(mocker, model_type=ReportScheduleType.ALERT, database_id=5)
-    _setup_mocks(mocker, model)
-
-    cmd = UpdateReportScheduleCommand(model_id=1, data={})
-    cmd.validate()  # should not raise
-
-
-def test_alert_no_database_anywhere_rejected(mocker: MockerFixture) -> None:
-    model = _make_model(mocker, model_type=ReportScheduleType.ALERT, database_id=None)
-    _setup_mocks(mocker, model)
-
-    cmd = UpdateReportScheduleCommand(model_id=1, data={})
-    with pytest.raises(ReportScheduleInvalidError) as exc_info:
-        cmd.validate()
-    messages = _get_validation_messages(exc_info)
-    assert "database" in messages
-    assert "required" in messages["database"].lower()
-
-
-# --- Type transitions ---
-
-
-def test_alert_to_report_without_clearing_db_rejected(mocker: MockerFixture) -> None:
-    model = _make_model(mocker, model_type=ReportScheduleType.ALERT, database_id=5)
-    _setup_mocks(mocker, model)
-
-    cmd = UpdateReportScheduleCommand(
-        model_id=1, data={"type": ReportScheduleType.REPORT}
-    )
-    with pytest.raises(ReportScheduleInvalidError) as exc_info:
-        cmd.validate()
-    messages = _get_validation_messages(exc_info)
-    assert "database" in messages
-    assert "not allowed" in messages["database"].lower()
-
-
-def test_alert_to_report_with_db_cleared_accepted(mocker: MockerFixture) -> None:
-    model = _make_model(mocker, model_type=ReportScheduleType.ALERT, database_id=5)
+    model = _make_model(mocker, model_type=model_type, database_id=database_id)
     _setup_mocks(mocker, model)
 
-    cmd = UpdateReportScheduleCommand(
-        model_id=1,
-        data={"type": ReportScheduleType.REPORT, "database": None},
-    )
-    cmd.validate()  # should not raise
-
-
-def test_report_to_alert_without_db_rejected(mocker: MockerFixture) -> None:
-    model = _make_model(mocker, model_type=ReportScheduleType.REPORT, database_id=None)
-    _setup_mocks(mocker, model)
+    cmd = UpdateReportScheduleCommand(model_id=1, data=data)
+    if expected_error is None:
+        cmd.validate()  # should not raise
+        return
 
-    cmd = UpdateReportScheduleCommand(
-        model_id=1, data={"type": ReportScheduleType.ALERT}
-    )
     with pytest.raises(ReportScheduleInvalidError) as exc_info:
         cmd.validate()
-    messages = _get_validation_messages(exc_info)
-    assert "database" in messages
-    assert "required" in messages["database"].lower()
+    message = _get_validation_message(exc_info, "database")
+    assert expected_error in message.lower()
 
 
 def test_report_with_nonexistent_database_returns_not_allowed(
@@ -244,21 +225,9 @@ def test_report_with_nonexistent_database_returns_not_allowed(
     cmd = UpdateReportScheduleCommand(model_id=1, data={"database": 99999})
     with pytest.raises(ReportScheduleInvalidError) as exc_info:
         cmd.validate()
-    messages = _get_validation_messages(exc_info)
-    assert "database" in messages
-    assert "not allowed" in messages["database"].lower()
-    assert "does not exist" not in messages["database"].lower()
-
-
-def test_report_to_alert_with_db_accepted(mocker: MockerFixture) -> None:
-    model = _make_model(mocker, model_type=ReportScheduleType.REPORT, database_id=None)
-    _setup_mocks(mocker, model)
-
-    cmd = UpdateReportScheduleCommand(
-        model_id=1,
-        data={"type": ReportScheduleType.ALERT, "database": 5},
-    )
-    cmd.validate()  # should not raise
+    message = _get_validation_message(exc_info, "database")
+    assert "not allowed" in message.lower()
+    assert "does not exist" not in message.lower()
 
 
 # --- Recipient enforcement for chart/dashboard reports ---
@@ -393,8 +362,7 @@ def test_chart_report_update_no_user_email_raises(mocker: MockerFixture) -> None
         with pytest.raises(ReportScheduleInvalidError) as exc_info:
             cmd.validate()
 
-    messages = _get_validation_messages(exc_info)
-    assert "recipients" in messages
+    _get_validation_message(exc_info, "recipients")
 
 
 # --- Deactivation state reset ---
@@ -464,9 +432,8 @@ def test_update_rejects_invalid_active_tab_ids(mocker: MockerFixture) -> None:
     )
     with pytest.raises(ReportScheduleInvalidError) as exc_info:
         cmd.validate()
-    messages = _get_validation_messages(exc_info)
-    assert "extra" in messages
-    assert "invalid tab ids" in messages["extra"].lower()
+    message = _get_validation_message(exc_info, "extra")
+    assert "invalid tab ids" in message.lower()
 
 
 def test_update_accepts_valid_active_tab_ids(mocker: MockerFixture) -> None:
@@ -497,6 +464,5 @@ def test_alert_with_nonexistent_database_rejected(mocker: MockerFixture) -> None
     cmd = UpdateReportScheduleCommand(model_id=1, data={"database": 99999})
     with pytest.raises(ReportScheduleInvalidError) as exc_info:
         cmd.validate()
-    messages = _get_validation_messages(exc_info)
-    assert "database" in messages
-    assert "does not exist" in messages["database"].lower()
+    message = _get_validation_message(exc_info, "database")
+    assert "does not exist" in message.lower()
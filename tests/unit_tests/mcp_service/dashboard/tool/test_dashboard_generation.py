@@ -29,7 +29,11 @@ from fastmcp import Client
 
 from superset.mcp_service.app import mcp
 from superset.mcp_service.chart.chart_utils import DatasetValidationResult
-from superset.mcp_service.dashboard.constants import generate_id
+from superset.mcp_service.dashboard.constants import (
+    _id_random,
+    generate_id,
+    generate_ids,
+)
 from superset.mcp_service.dashboard.tool.add_chart_to_existing_dashboard import (
     _add_chart_to_layout,
     _collect_available_tab_names,
@@ -1640,6 +1644,28 @@ class TestLayoutHelpers:
         ids = {generate_id("ROW") for _ in range(100)}
         assert len(ids) == 100
 
+    def test_generate_ids_format_and_uniqueness(self):
+        """Test that generate_ids produces unique IDs in the generate_id format."""
+        ids = generate_ids("COLUMN", 100)
+        assert len(ids) == 100
+        assert len(set(ids)) == 100
+        assert all(i.startswith("COLUMN-") and len(i) == 15 for i in ids)
+
+        assert generate_ids("ROW", 0) == []
+
+    def test_generate_id_sequence_changes_after_fork_reseed(self):
+        """Test that the after-fork reseed hook changes the ID sequence."""
+        state = _id_random.getstate()
+        try:
+            before = generate_ids("ROW", 4)
+            _id_random.setstate(state)
+            # The hook registered with os.register_at_fork for forked children
+            _id_random.seed()
+            after = generate_ids("ROW", 4)
+        finally:
+            _id_random.setstate(state)
+        assert after != before
+
     def test_find_next_row_position_empty_layout(self):
         """Test _find_next_row_position with empty layout."""
         result = _find_next_row_position({})
@@ -17,44 +17,44 @@
 
 """Tests for system-level utility functions."""
 
-from unittest.mock import MagicMock, patch
-
-from superset.mcp_service.system.system_utils import calculate_feature_availability
-
-
-def test_calculate_feature_availability_returns_menus():
-    """Test that accessible menus are returned."""
-    mock_sm = MagicMock()
-    mock_sm.user_view_menu_names.return_value = {
-        "SQL Lab",
-        "Dashboards",
-        "Charts",
-    }
-
-    with patch("superset.security_manager", mock_sm):
-        result = calculate_feature_availability({}, {}, {})
-
-    assert result.accessible_menus == ["Charts", "Dashboards", "SQL Lab"]
-    mock_sm.user_view_menu_names.assert_called_once_with("menu_access")
+from types import SimpleNamespace
 
+import pytest
 
-def test_calculate_feature_availability_empty_when_no_context():
-    """Test graceful fallback when security manager is unavailable."""
-    broken_sm = MagicMock()
-    broken_sm.user_view_menu_names.side_effect = RuntimeError("no ctx")
-
-    with patch("superset.security_manager", broken_sm):
-        result = calculate_feature_availability({}, {}, {})
-
-    assert result.accessible_menus == []
-
-
-def test_calculate_feature_availability_menus_sorted():
-    """Test that accessible menus are returned in sorted order."""
-    mock_sm = MagicMock()
-    mock_sm.user_view_menu_names.return_value = {"Zzz", "Aaa", "Mmm"}
+import superset
+from superset.mcp_service.system.system_utils import calculate_feature_availability
 
-    with patch("superset.security_manager", mock_sm):
-        result = calculate_feature_availability({}, {}, {})
 
-    assert result.accessible_menus == ["Aaa", "Mmm", "Zzz"]
+@pytest.mark.parametrize(
+    "menu_names,expected_menus",
+    [
+        pytest.param(
+            {"SQL Lab", "Dashboards", "Charts"},
+            ["Charts", "Dashboards", "SQL Lab"],
+            id="three_menus",
+        ),
+        pytest.param({"Zzz", "Aaa", "Mmm"}, ["Aaa", "Mmm", "Zzz"], id="sorted"),
+        # Graceful fallback when the security manager is unavailable
+        pytest.param(RuntimeError("no ctx"), [], id="broken_sm"),
+    ],
+)
+def test_calculate_feature_availability(monkeypatch, menu_names, expected_menus):
+    """Test that accessible menus are returned sorted, or empty on failure."""
+    calls = []
+
+    def user_view_menu_names(permission_name):
+        calls.append(permission_name)
+        if isinstance(menu_names, Exception):
+            raise menu_names
+        return menu_names
+
+    monkeypatch.setattr(
+        superset,
+        "security_manager",
+        SimpleNamespace(user_view_menu_names=user_view_menu_names),
+    )
+
+    result = calculate_feature_availability({}, {}, {})
+
+    assert result.accessible_menus == expected_menus
+    assert calls == ["menu_access"]
@@ -21,28 +21,37 @@ import asyncio
 import base64
 import logging
 import time
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 from authlib.jose.errors import BadSignatureError, DecodeError, ExpiredTokenError
+from starlette.authentication import AuthenticationError
+from starlette.datastructures import Headers
 
 from superset.mcp_service.jwt_verifier import (
     _auth_error_handler,
     _jwt_failure_reason,
+    _sanitize_for_log,
+    _warn_on_weak_jwt_config,
     DetailedBearerAuthBackend,
     DetailedJWTVerifier,
 )
 from superset.utils import json
 
 
+def _b64_segment(obj: dict[str, object]) -> str:
+    """Encode a dict as an unpadded base64url JWT segment of compact JSON."""
+    raw = json.dumps(obj, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
 def _make_token(
     header: dict[str, str], payload: dict[str, object], signature: str = "sig"
 ) -> str:
     """Build a fake JWT string from header + payload dicts."""
-    h = base64.urlsafe_b64encode(json.dumps(header).encode()).rstrip(b"=").decode()
-    p = base64.urlsafe_b64encode(json.dumps(payload).encode()).rstrip(b"=").decode()
-    return f"{h}.{p}.{signature}"
+    return f"{_b64_segment(header)}.{_b64_segment(payload)}.{signature}"
 
 
 @pytest.fixture
@@ -122,8 +131,6 @@ async def test_malformed_token_header(hs256_verifier):
 @pytest.mark.asyncio
 async def test_jwks_network_error_is_handled(hs256_verifier):
     """A network error fetching the JWKS key is handled, not propagated."""
-    import httpx
-
     token = _make_token(
         {"alg": "HS256", "typ": "JWT"},
         {"sub": "user1", "iss": "test-issuer", "aud": "test-audience"},
@@ -141,49 +148,40 @@ async def test_jwks_network_error_is_handled(hs256_verifier):
 
 
 @pytest.mark.asyncio
-async def test_signature_verification_failed(hs256_verifier):
-    """Token with bad signature should report signature failure."""
+@pytest.mark.parametrize(
+    "decode_error,expected_reason",
+    [
+        (BadSignatureError(result=None), "Signature verification failed"),
+        (ExpiredTokenError(), "Token has expired (detected during decode)"),
+        (DecodeError("bad token"), "Token decode failed"),
+    ],
+    ids=["bad_signature", "expired", "decode_error"],
+)
+async def test_decode_failure_reason(hs256_verifier, decode_error, expected_reason):
+    """Errors raised by jwt.decode should map to a generic failure reason."""
     token = _make_token(
         {"alg": "HS256", "typ": "JWT"},
-        {
-            "sub": "user1",
-            "iss": "test-issuer",
-            "aud": "test-audience",
-            "exp": int(time.time()) + 3600,
-        },
+        {"sub": "user1", "iss": "test-issuer", "aud": "test-audience"},
     )
 
-    with patch.object(
-        hs256_verifier.jwt,
-        "decode",
-        side_effect=BadSignatureError(result=None),
-    ):
+    with patch.object(hs256_verifier.jwt, "decode", side_effect=decode_error):
         result = await hs256_verifier.load_access_token(token)
 
     assert result is None
-    reason = _jwt_failure_reason.get()
-    assert reason == "Signature verification failed"
+    assert _jwt_failure_reason.get() == expected_reason
 
 
 @pytest.mark.asyncio
 async def test_expired_token(hs256_verifier):
     """Expired token should report token expired."""
     expired_time = int(time.time()) - 3600
-    token = _make_token(
-        {"alg": "HS256", "typ": "JWT"},
-        {
-            "sub": "user1",
-            "iss": "test-issuer",
-            "aud": "test-audience",
-            "exp": expired_time,
-        },
-    )
     claims = {
         "sub": "user1",
         "iss": "test-issuer",
         "aud": "test-audience",
         "exp": expired_time,
     }
+    token = _make_token({"alg": "HS256", "typ": "JWT"}, claims)
 
     with patch.object(hs256_verifier.jwt, "decode", return_value=claims):
         result = await hs256_verifier.load_access_token(token)
@@ -198,13 +196,13 @@ async def test_expired_token(hs256_verifier):
 @pytest.mark.asyncio
 async def test_token_with_future_nbf_rejected(hs256_verifier):
     """Token whose nbf is in the future should report not-yet-valid."""
-    future_nbf = int(time.time()) + 3600
+    now = int(time.time())
     claims = {
         "sub": "user1",
         "iss": "test-issuer",
         "aud": "test-audience",
-        "exp": int(time.time()) + 7200,
-        "nbf": future_nbf,
+        "exp": now + 7200,
+        "nbf": now + 3600,
     }
     token = _make_token({"alg": "HS256", "typ": "JWT"}, claims)
 
@@ -221,21 +219,14 @@ async def test_token_with_future_nbf_rejected(hs256_verifier):
 @pytest.mark.asyncio
 async def test_issuer_mismatch(hs256_verifier):
     """Token with wrong issuer should report issuer mismatch."""
-    token = _make_token(
-        {"alg": "HS256", "typ": "JWT"},
-        {
-            "sub": "user1",
-            "iss": "wrong-issuer",
-            "aud": "test-audience",
-            "exp": int(time.time()) + 3600,
-        },
-    )
+    future_exp = int(time.time()) + 3600
     claims = {
         "sub": "user1",
         "iss": "wrong-issuer",
         "aud": "test-audience",
-        "exp": int(time.time()) + 3600,
+        "exp": future_exp,
     }
+    token = _make_token({"alg": "HS256", "typ": "JWT"}, claims)
 
     with patch.object(hs256_verifier.jwt, "decode", return_value=claims):
         result = await hs256_verifier.load_access_token(token)
@@ -251,21 +242,14 @@ async def test_issuer_mismatch(hs256_verifier):
 @pytest.mark.asyncio
 async def test_audience_mismatch(hs256_verifier):
     """Token with wrong audience should report audience mismatch."""
-    token = _make_token(
-        {"alg": "HS256", "typ": "JWT"},
-        {
-            "sub": "user1",
-            "iss": "test-issuer",
-            "aud": "wrong-audience",
-            "exp": int(time.time()) + 3600,
-        },
-    )
+    future_exp = int(time.time()) + 3600
     claims = {
         "sub": "user1",
         "iss": "test-issuer",
         "aud": "wrong-audience",
-        "exp": int(time.time()) + 3600,
+        "exp": future_exp,
     }
+    token = _make_token({"alg": "HS256", "typ": "JWT"}, claims)
 
     with patch.object(hs256_verifier.jwt, "decode", return_value=claims):
         result = await hs256_verifier.load_access_token(token)
@@ -281,25 +265,17 @@ async def test_audience_mismatch(hs256_verifier):
 @pytest.mark.asyncio
 async def test_missing_required_scopes(hs256_verifier):
     """Token missing required scopes should report missing scopes."""
+    future_exp = int(time.time()) + 3600
     hs256_verifier.required_scopes = ["admin", "read"]
 
-    token = _make_token(
-        {"alg": "HS256", "typ": "JWT"},
-        {
-            "sub": "user1",
-            "iss": "test-issuer",
-            "aud": "test-audience",
-            "exp": int(time.time()) + 3600,
-            "scope": "read",
-        },
-    )
     claims = {
         "sub": "user1",
         "iss": "test-issuer",
         "aud": "test-audience",
-        "exp": int(time.time()) + 3600,
+        "exp": future_exp,
         "scope": "read",
     }
+    token = _make_token({"alg": "HS256", "typ": "JWT"}, claims)
 
     with patch.object(hs256_verifier.jwt, "decode", return_value=claims):
         result = await hs256_verifier.load_access_token(token)
@@ -315,21 +291,13 @@ async def test_missing_required_scopes(hs256_verifier):
 async def test_valid_token(hs256_verifier):
     """Valid token should return AccessToken and clear contextvar."""
     future_exp = int(time.time()) + 3600
-    token = _make_token(
-        {"alg": "HS256", "typ": "JWT"},
-        {
-            "sub": "user1",
-            "iss": "test-issuer",
-            "aud": "test-audience",
-            "exp": future_exp,
-        },
-    )
     claims = {
         "sub": "user1",
         "iss": "test-issuer",
         "aud": "test-audience",
         "exp": future_exp,
     }
+    token = _make_token({"alg": "HS256", "typ": "JWT"}, claims)
 
     with patch.object(hs256_verifier.jwt, "decode", return_value=claims):
         result = await hs256_verifier.load_access_token(token)
@@ -408,19 +376,12 @@ async def test_success_log_tolerates_non_orderable_scopes(hs256_verifier, caplog
 @pytest.mark.asyncio
 async def test_token_without_expiration_rejected(hs256_verifier):
     """Token without an exp claim must be rejected (exp is required)."""
-    token = _make_token(
-        {"alg": "HS256", "typ": "JWT"},
-        {
-            "sub": "user1",
-            "iss": "test-issuer",
-            "aud": "test-audience",
-        },
-    )
     claims = {
         "sub": "user1",
         "iss": "test-issuer",
         "aud": "test-audience",
     }
+    token = _make_token({"alg": "HS256", "typ": "JWT"}, claims)
 
     with patch.object(hs256_verifier.jwt, "decode", return_value=claims):
         result = await hs256_verifier.load_access_token(token)
@@ -484,26 +445,6 @@ async def test_non_numeric_expiration_rejected(hs256_verifier):
     assert _jwt_failure_reason.get() == "Token has invalid expiration"
 
 
-@pytest.mark.asyncio
-async def test_decode_error(hs256_verifier):
-    """Token that fails to decode should report decode failure."""
-    token = _make_token(
-        {"alg": "HS256", "typ": "JWT"},
-        {"sub": "user1"},
-    )
-
-    with patch.object(
-        hs256_verifier.jwt,
-        "decode",
-        side_effect=DecodeError("bad token"),
-    ):
-        result = await hs256_verifier.load_access_token(token)
-
-    assert result is None
-    reason = _jwt_failure_reason.get()
-    assert reason == "Token decode failed"
-
-
 @pytest.mark.asyncio
 async def test_verification_key_failure(hs256_verifier):
     """Failure to get verification key should report specific error."""
@@ -591,21 +532,13 @@ async def test_contextvar_cleared_on_success(hs256_verifier):
     _jwt_failure_reason.set("previous failure")
 
     future_exp = int(time.time()) + 3600
-    token = _make_token(
-        {"alg": "HS256", "typ": "JWT"},
-        {
-            "sub": "user1",
-            "iss": "test-issuer",
-            "aud": "test-audience",
-            "exp": future_exp,
-        },
-    )
     claims = {
         "sub": "user1",
         "iss": "test-issuer",
         "aud": "test-audience",
         "exp": future_exp,
     }
+    token = _make_token({"alg": "HS256", "typ": "JWT"}, claims)
 
     with patch.object(hs256_verifier.jwt, "decode", return_value=claims):
         result = await hs256_verifier.load_access_token(token)
@@ -650,29 +583,17 @@ def test_get_middleware_returns_custom_components(hs256_verifier):
     assert auth_middleware.kwargs["on_error"] is _auth_error_handler
 
 
-class _FakeHeaders(dict[str, str]):
-    """A dict subclass that allows overriding .get() for mock connections."""
-
-    def __init__(self, *args: object, **kwargs: object) -> None:
-        super().__init__(*args, **kwargs)
-
-    def get(self, key: str, default: str | None = None) -> str | None:  # type: ignore[override]
-        return super().get(key, default)
-
-
 @pytest.mark.asyncio
 async def test_detailed_bearer_backend_raises_on_failure():
     """DetailedBearerAuthBackend should raise AuthenticationError with reason."""
-    from starlette.authentication import AuthenticationError
-
     mock_verifier = MagicMock()
     mock_verifier.verify_token = AsyncMock(return_value=None)
 
     backend = DetailedBearerAuthBackend(mock_verifier)
 
-    # Mock connection with Bearer token
-    mock_conn = MagicMock()
-    mock_conn.headers = _FakeHeaders({"authorization": "Bearer some-token"})
+    # Mock connection with Bearer token; the mixed-case header name checks that
+    # the lookup relies on Starlette's case-insensitive Headers
+    mock_conn = SimpleNamespace(headers=Headers({"Authorization": "Bearer some-token"}))
 
     # Set failure reason (generic, no claim values)
     _jwt_failure_reason.set("Token expired")
@@ -695,8 +616,9 @@ async def test_detailed_bearer_backend_passes_through_success():
 
     backend = DetailedBearerAuthBackend(mock_verifier)
 
-    mock_conn = MagicMock()
-    mock_conn.headers = _FakeHeaders({"authorization": "Bearer valid-token"})
+    mock_conn = SimpleNamespace(
+        headers=Headers({"Authorization": "Bearer valid-token"})
+    )
 
     result = await backend.authenticate(mock_conn)
 
@@ -713,57 +635,52 @@ async def test_detailed_bearer_backend_no_bearer_token():
     backend = DetailedBearerAuthBackend(mock_verifier)
 
     # Mock connection without auth header
-    mock_conn = MagicMock()
-    mock_conn.headers = _FakeHeaders({})
+    mock_conn = SimpleNamespace(headers=Headers())
 
     result = await backend.authenticate(mock_conn)
 
     assert result is None
 
 
-def test_error_handler_never_leaks_jwt_details():
+# Simulated failure reasons that contain sensitive claim values
+@pytest.mark.parametrize(
+    "reason",
+    [
+        "Algorithm mismatch: token uses 'RS256', expected 'HS256'",
+        "Issuer mismatch: token has 'https://evil.com', expected 'https://good.com'",
+        "Audience mismatch: token has 'wrong-aud', expected 'my-api'",
+        "Token expired for client 'admin-service'",
+        "Missing required scopes: {'admin'}. Token has: {'read'}",
+    ],
+)
+def test_error_handler_never_leaks_jwt_details(reason):
     """Error handler MUST return generic error per RFC 6750 Section 3.1.
 
     No JWT claim values, server config, or validation details should
     ever appear in the HTTP response - regardless of the failure type.
     References: CVE-2022-29266, CVE-2019-7644.
     """
-    from starlette.authentication import AuthenticationError
+    # A non-browser request: no method, no headers, no client address
+    mock_conn = SimpleNamespace(scope={}, headers=Headers())
 
-    mock_conn = MagicMock()
+    response = _auth_error_handler(mock_conn, AuthenticationError(reason))
 
-    # Simulate various failure reasons that contain sensitive claim values
-    sensitive_reasons = [
-        "Algorithm mismatch: token uses 'RS256', expected 'HS256'",
-        "Issuer mismatch: token has 'https://evil.com', expected 'https://good.com'",
-        "Audience mismatch: token has 'wrong-aud', expected 'my-api'",
-        "Token expired for client 'admin-service'",
-        "Missing required scopes: {'admin'}. Token has: {'read'}",
-    ]
-
-    for reason in sensitive_reasons:
-        exc = AuthenticationError(reason)
-        response = _auth_error_handler(mock_conn, exc)
+    assert response.status_code == 401
 
-        assert response.status_code == 401
+    body = json.loads(response.body)
+    # Body must only have generic message
+    assert body["error"] == "invalid_token"
+    assert body["error_description"] == "Authentication failed"
 
-        body = json.loads(response.body.decode())
-        # Body must only have generic message
-        assert body["error"] == "invalid_token", f"Wrong error code for: {reason}"
-        assert body["error_description"] == "Authentication failed", (
-            f"Detailed reason leaked for: {reason}"
-        )
-
-        # WWW-Authenticate must not contain any claim values
-        www_auth = response.headers.get("www-authenticate", "")
-        assert www_auth == 'Bearer error="invalid_token"', (
-            f"Detailed reason leaked in header for: {reason}"
-        )
+    # WWW-Authenticate must not contain any claim values
+    www_auth = response.headers.get("www-authenticate", "")
+    assert www_auth == 'Bearer error="invalid_token"'
 
 
 @pytest.mark.asyncio
 async def test_audience_mismatch_list_audience():
     """Token audience not in allowed audience list should fail."""
+    future_exp = int(time.time()) + 3600
     verifier = DetailedJWTVerifier(
         public_key="test-secret",
         issuer="test-issuer",
@@ -771,21 +688,13 @@ async def test_audience_mismatch_list_audience():
         algorithm="HS256",
     )
 
-    token = _make_token(
-        {"alg": "HS256", "typ": "JWT"},
-        {
-            "sub": "user1",
-            "iss": "test-issuer",
-            "aud": "wrong-aud",
-            "exp": int(time.time()) + 3600,
-        },
-    )
     claims = {
         "sub": "user1",
         "iss": "test-issuer",
         "aud": "wrong-aud",
-        "exp": int(time.time()) + 3600,
+        "exp": future_exp,
     }
+    token = _make_token({"alg": "HS256", "typ": "JWT"}, claims)
 
     with patch.object(verifier.jwt, "decode", return_value=claims):
         result = await verifier.load_access_token(token)
@@ -795,9 +704,70 @@ async def test_audience_mismatch_list_audience():
     assert reason == "Audience mismatch"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "token_aud,accepted",
+    [
+        (["other", "aud2"], True),
+        ([{"nested": "aud1"}, "aud1"], True),
+        ([{"nested": "aud1"}, ["aud2"]], False),
+        ([], False),
+        (None, False),
+    ],
+)
+async def test_audience_list_claim(token_aud, accepted):
+    """A list aud claim matches if any string entry is an allowed audience."""
+    verifier = DetailedJWTVerifier(
+        public_key="test-secret",
+        issuer="test-issuer",
+        audience=["aud1", "aud2"],
+        algorithm="HS256",
+    )
+    token = _make_token({"alg": "HS256", "typ": "JWT"}, {"sub": "user1"})
+    claims = {
+        "sub": "user1",
+        "iss": "test-issuer",
+        "aud": token_aud,
+        "exp": int(time.time()) + 3600,
+    }
+
+    with patch.object(verifier.jwt, "decode", return_value=claims):
+        result = await verifier.load_access_token(token)
+
+    assert (result is not None) is accepted
+    if not accepted:
+        assert _jwt_failure_reason.get() == "Audience mismatch"
+
+
+@pytest.mark.asyncio
+async def test_audience_list_edited_in_place_is_honored():
+    """Extending the allowed audience list should apply to later tokens."""
+    verifier = DetailedJWTVerifier(
+        public_key="test-secret",
+        issuer="test-issuer",
+        audience=["aud1"],
+        algorithm="HS256",
+    )
+    token = _make_token({"alg": "HS256", "typ": "JWT"}, {"sub": "user1"})
+    claims = {
+        "sub": "user1",
+        "iss": "test-issuer",
+        "aud": "aud2",
+        "exp": int(time.time()) + 3600,
+    }
+
+    with patch.object(verifier.jwt, "decode", return_value=claims):
+        assert await verifier.load_access_token(token) is None
+        assert _jwt_failure_reason.get() == "Audience mismatch"
+
+        verifier.audience.append("aud2")
+        assert await verifier.load_access_token(token) is not None
+
+
 @pytest.mark.asyncio
 async def test_issuer_mismatch_list_issuer():
     """Token issuer not in allowed issuer list should fail."""
+    future_exp = int(time.time()) + 3600
     verifier = DetailedJWTVerifier(
         public_key="test-secret",
         issuer=["iss1", "iss2"],
@@ -805,21 +775,13 @@ async def test_issuer_mismatch_list_issuer():
         algorithm="HS256",
     )
 
-    token = _make_token(
-        {"alg": "HS256", "typ": "JWT"},
-        {
-            "sub": "user1",
-            "iss": "wrong-issuer",
-            "aud": "test-audience",
-            "exp": int(time.time()) + 3600,
-        },
-    )
     claims = {
         "sub": "user1",
         "iss": "wrong-issuer",
         "aud": "test-audience",
-        "exp": int(time.time()) + 3600,
+        "exp": future_exp,
     }
+    token = _make_token({"alg": "HS256", "typ": "JWT"}, claims)
 
     with patch.object(verifier.jwt, "decode", return_value=claims):
         result = await verifier.load_access_token(token)
@@ -831,14 +793,57 @@ async def test_issuer_mismatch_list_issuer():
     assert "wrong-issuer" not in reason
 
 
+@pytest.mark.asyncio
+async def test_reassigned_required_scopes_are_honored(hs256_verifier):
+    """Scope requirements changed after construction should apply to later tokens."""
+    future_exp = int(time.time()) + 3600
+    token = _make_token({"alg": "HS256", "typ": "JWT"}, {"sub": "user1"})
+    claims = {
+        "sub": "user1",
+        "iss": "test-issuer",
+        "aud": "test-audience",
+        "exp": future_exp,
+        "scope": "read",
+    }
+
+    with patch.object(hs256_verifier.jwt, "decode", return_value=claims):
+        assert await hs256_verifier.load_access_token(token) is not None
+
+        hs256_verifier.required_scopes = ["admin"]
+        assert await hs256_verifier.load_access_token(token) is None
+        assert _jwt_failure_reason.get() == "Missing required scopes"
+
+        hs256_verifier.required_scopes = ["read"]
+        assert await hs256_verifier.load_access_token(token) is not None
+
+
+@pytest.mark.asyncio
+async def test_required_scopes_edited_in_place_are_honored(hs256_verifier):
+    """Appending to the required scopes list should apply to later tokens."""
+    token = _make_token({"alg": "HS256", "typ": "JWT"}, {"sub": "user1"})
+    claims = {
+        "sub": "user1",
+        "iss": "test-issuer",
+        "aud": "test-audience",
+        "exp": int(time.time()) + 3600,
+        "scope": "read",
+    }
+
+    with patch.object(hs256_verifier.jwt, "decode", return_value=claims):
+        assert await hs256_verifier.load_access_token(token) is not None
+
+        hs256_verifier.required_scopes.append("admin")
+        assert await hs256_verifier.load_access_token(token) is None
+        assert _jwt_failure_reason.get() == "Missing required scopes"
+
+
 def test_decode_token_header_padding_multiple_of_4():
     """_decode_token_header should handle headers whose length is a multiple of 4."""
     # eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9 is 36 chars (divisible by 4)
     # This is the standard HS256/JWT header
     header = {"alg": "HS256", "typ": "JWT"}
-    header_b64 = (
-        base64.urlsafe_b64encode(json.dumps(header).encode()).rstrip(b"=").decode()
-    )
+    header_b64 = _b64_segment(header)
+    assert header_b64 == "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9"
     token = f"{header_b64}.payload.signature"
 
     result = DetailedJWTVerifier._decode_token_header(token)
@@ -850,21 +855,14 @@ def test_decode_token_header_padding_multiple_of_4():
 @pytest.mark.asyncio
 async def test_warning_logs_never_contain_claim_values(hs256_verifier, caplog):
     """WARNING logs must contain only generic categories; details go to DEBUG."""
-    token = _make_token(
-        {"alg": "HS256", "typ": "JWT"},
-        {
-            "sub": "user1",
-            "iss": "wrong-issuer",
-            "aud": "test-audience",
-            "exp": int(time.time()) + 3600,
-        },
-    )
+    future_exp = int(time.time()) + 3600
     claims = {
         "sub": "user1",
         "iss": "wrong-issuer",
         "aud": "test-audience",
-        "exp": int(time.time()) + 3600,
+        "exp": future_exp,
     }
+    token = _make_token({"alg": "HS256", "typ": "JWT"}, claims)
 
     with caplog.at_level(logging.DEBUG, logger="superset.mcp_service.jwt_verifier"):
         with patch.object(hs256_verifier.jwt, "decode", return_value=claims):
@@ -879,31 +877,26 @@ async def test_warning_logs_never_contain_claim_values(hs256_verifier, caplog):
         assert "test-issuer" not in msg
 
     # DEBUG logs should contain the detailed values
-    debug_messages = [r.message for r in caplog.records if r.levelno == logging.DEBUG]
-    assert any("wrong-issuer" in msg for msg in debug_messages)
+    debug_log = "\n".join(
+        r.message for r in caplog.records if r.levelno == logging.DEBUG
+    )
+    assert "wrong-issuer" in debug_log
 
 
 @pytest.mark.asyncio
 async def test_hs256_secret_never_logged(hs256_verifier, caplog):
     """The HS256 secret key must never appear in any log at any level."""
+    future_exp = int(time.time()) + 3600
     # This matches the public_key value from the hs256_verifier fixture
     hs256_signing_value = "test-secret-key-for-hs256-tokens"
 
-    token = _make_token(
-        {"alg": "HS256", "typ": "JWT"},
-        {
-            "sub": "user1",
-            "iss": "wrong-issuer",
-            "aud": "test-audience",
-            "exp": int(time.time()) + 3600,
-        },
-    )
     claims = {
         "sub": "user1",
         "iss": "wrong-issuer",
         "aud": "test-audience",
-        "exp": int(time.time()) + 3600,
+        "exp": future_exp,
     }
+    token = _make_token({"alg": "HS256", "typ": "JWT"}, claims)
 
     with caplog.at_level(logging.DEBUG, logger="superset.mcp_service.jwt_verifier"):
         with patch.object(hs256_verifier.jwt, "decode", return_value=claims):
@@ -915,49 +908,17 @@ async def test_hs256_secret_never_logged(hs256_verifier, caplog):
         assert hs256_signing_value not in msg, f"HS256 secret leaked in log: {msg}"
 
 
-@pytest.mark.asyncio
-async def test_expired_token_during_decode(hs256_verifier):
-    """ExpiredTokenError raised by jwt.decode should set generic reason."""
-    token = _make_token(
-        {"alg": "HS256", "typ": "JWT"},
-        {
-            "sub": "user1",
-            "iss": "test-issuer",
-            "aud": "test-audience",
-            "exp": int(time.time()) - 3600,
-        },
-    )
-
-    with patch.object(
-        hs256_verifier.jwt,
-        "decode",
-        side_effect=ExpiredTokenError(),
-    ):
-        result = await hs256_verifier.load_access_token(token)
-
-    assert result is None
-    reason = _jwt_failure_reason.get()
-    assert reason == "Token has expired (detected during decode)"
-
-
 @pytest.mark.asyncio
 async def test_catch_all_exception_sets_generic_reason(hs256_verifier):
     """Catch-all handler should set generic reason without exception details."""
-    token = _make_token(
-        {"alg": "HS256", "typ": "JWT"},
-        {
-            "sub": "user1",
-            "iss": "test-issuer",
-            "aud": "test-audience",
-            "exp": int(time.time()) + 3600,
-        },
-    )
+    future_exp = int(time.time()) + 3600
     claims = {
         "sub": "user1",
         "iss": "test-issuer",
         "aud": "test-audience",
-        "exp": int(time.time()) + 3600,
+        "exp": future_exp,
     }
+    token = _make_token({"alg": "HS256", "typ": "JWT"}, claims)
 
     with patch.object(hs256_verifier.jwt, "decode", return_value=claims):
         with patch.object(
@@ -977,16 +938,6 @@ async def test_catch_all_exception_sets_generic_reason(hs256_verifier):
 async def test_successful_auth_logged_with_safe_metadata(hs256_verifier, caplog):
     """Successful auth emits an INFO log with safe metadata, no token/secret."""
     future_exp = int(time.time()) + 3600
-    token = _make_token(
-        {"alg": "HS256", "typ": "JWT"},
-        {
-            "sub": "user1",
-            "iss": "test-issuer",
-            "aud": "test-audience",
-            "exp": future_exp,
-            "scope": "read write",
-        },
-    )
     claims = {
         "sub": "user1",
         "iss": "test-issuer",
@@ -994,6 +945,7 @@ async def test_successful_auth_logged_with_safe_metadata(hs256_verifier, caplog)
         "exp": future_exp,
         "scope": "read write",
     }
+    token = _make_token({"alg": "HS256", "typ": "JWT"}, claims)
 
     with caplog.at_level(logging.INFO, logger="superset.mcp_service.jwt_verifier"):
         with patch.object(hs256_verifier.jwt, "decode", return_value=claims):
@@ -1015,8 +967,6 @@ async def test_successful_auth_logged_with_safe_metadata(hs256_verifier, caplog)
 def test_sanitize_for_log_escapes_newlines():
     """_sanitize_for_log escapes newline/carriage-return/tab to prevent
     log-line injection from attacker-controlled claim values."""
-    from superset.mcp_service.jwt_verifier import _sanitize_for_log
-
     injected = "RS256\nFAKE LOG LINE: admin authenticated"
     sanitized = _sanitize_for_log(injected)
 
@@ -1117,8 +1067,6 @@ def test_warns_when_algorithm_not_configured(caplog):
     """A verifier with a falsy algorithm logs a WARNING that the algorithm is
     not pinned. (fastmcp's JWTVerifier coerces ``algorithm=None`` to a default,
     so we exercise the helper directly with an empty algorithm.)"""
-    from superset.mcp_service.jwt_verifier import _warn_on_weak_jwt_config
-
     with caplog.at_level(logging.WARNING):
         _warn_on_weak_jwt_config(audience="test-audience", algorithm=None)
 